@@ -3,7 +3,7 @@
 #  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Annotated
+from typing import Annotated, ClassVar
 
 from pydantic import BaseModel, Field
 
@@ -44,6 +44,13 @@ class QuestionModel(BaseModel):
 
 
 class BaseQuestion(ABC):
+    deterministic_start_attempt: ClassVar[bool] = False
+    """Whether :meth:`start_attempt` always results in the same attempt state and model for the same variant.
+
+    Questions which set this to ``True`` allow an :class:`~questionpy_common.attempt_pool.AttemptPool` to start a single
+    attempt per variant and hand it out repeatedly.
+    """
+
     @abstractmethod
     def start_attempt(self, variant: int) -> BaseAttempt:
         """Start an attempt at this question with the given variant.
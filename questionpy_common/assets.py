@@ -0,0 +1,149 @@
+#  This file is part of QuestionPy. (https://questionpy.org)
+#  QuestionPy is free software released under terms of the MIT license. See LICENSE.md.
+#  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
+"""Cache of the stylesheets and files of attempt UIs, prebuilt for HTTP responses."""
+
+import hashlib
+import mimetypes
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from threading import Lock
+
+from questionpy_common.api.attempt import AttemptUi
+from questionpy_common.environment import Package
+from questionpy_common.fingerprint import Fingerprinter
+
+__all__ = ["Asset", "AssetBundle", "AssetBundleCache"]
+
+_DEFAULT_MEDIA_TYPE = "application/octet-stream"
+
+
+def _etag(*parts: bytes) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(hashlib.sha256(part).digest())
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+@dataclass(frozen=True)
+class Asset:
+    """Content which can be sent to the browser as is."""
+
+    data: bytes
+    media_type: str
+    etag: str
+    """Strong HTTP entity tag derived from the content, including the quotes."""
+
+    @classmethod
+    def from_bytes(cls, data: bytes, media_type: str) -> "Asset":
+        return cls(data, media_type, _etag(media_type.encode(), data))
+
+
+@dataclass(frozen=True)
+class AssetBundle:
+    """The assets of an :class:`AttemptUi`."""
+
+    stylesheet: Asset | None
+    """The package's ``include_css_file`` followed by ``include_inline_css``, or ``None`` if neither is set."""
+    files: Mapping[str, Asset]
+    """The :attr:`AttemptUi.files` by name. Their data is encoded as UTF-8."""
+    etag: str
+    """Entity tag of the bundle as a whole."""
+
+
+_BundleKey = tuple[str, str, str | None, str | None, tuple[bytes, ...]]
+
+
+class AssetBundleCache:
+    """LRU cache of the asset bundles of packages.
+
+    CSS files are read from the package only when a bundle is built. Bundles of a package are dropped as soon as a
+    different version of it is used, or explicitly with :meth:`invalidate`.
+
+    Files are identified by their fingerprint, which is memoized per :class:`UiFile` instance, so files passed to
+    :meth:`get` must not be mutated afterwards.
+    """
+
+    def __init__(self, max_bundles: int = 256):
+        """Creates an empty cache.
+
+        Args:
+            max_bundles: Number of bundles to keep.
+        """
+        self._max_bundles = max_bundles
+        self._bundles: OrderedDict[_BundleKey, AssetBundle] = OrderedDict()
+        self._versions: dict[str, str] = {}
+        self._fingerprinter = Fingerprinter()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._bundles)
+
+    def get(self, package: Package, ui: AttemptUi) -> AssetBundle:
+        """Gets the bundle of an attempt UI of the given package, building it if necessary.
+
+        Raises:
+            FileNotFoundError: If ``include_css_file`` does not exist in the package.
+        """
+        manifest = package.manifest
+        key: _BundleKey = (
+            manifest.identifier,
+            manifest.version,
+            ui.include_css_file,
+            ui.include_inline_css,
+            tuple(map(self._fingerprinter, ui.files)),
+        )
+
+        with self._lock:
+            if self._versions.get(manifest.identifier) != manifest.version:
+                self._drop(manifest.identifier)
+                self._versions[manifest.identifier] = manifest.version
+            bundle = self._bundles.get(key)
+            if bundle is not None:
+                self._bundles.move_to_end(key)
+                return bundle
+
+        bundle = self._build(package, ui)
+        with self._lock:
+            # The package may have been invalidated or updated while the bundle was built.
+            if self._versions.get(manifest.identifier) == manifest.version:
+                self._bundles[key] = bundle
+                if len(self._bundles) > self._max_bundles:
+                    self._bundles.popitem(last=False)
+        return bundle
+
+    def invalidate(self, package: Package | str) -> None:
+        """Drops all bundles of a package, e.g. after it was replaced without changing its version.
+
+        Args:
+            package: The package or its identifier.
+        """
+        identifier = package if isinstance(package, str) else package.manifest.identifier
+        with self._lock:
+            self._drop(identifier)
+            self._versions.pop(identifier, None)
+
+    def _drop(self, identifier: str) -> None:
+        for key in [key for key in self._bundles if key[0] == identifier]:
+            del self._bundles[key]
+
+    @staticmethod
+    def _build(package: Package, ui: AttemptUi) -> AssetBundle:
+        parts = []
+        if ui.include_css_file is not None:
+            parts.append(package.get_path(ui.include_css_file).read_bytes())
+        if ui.include_inline_css is not None:
+            parts.append(ui.include_inline_css.encode())
+        stylesheet = Asset.from_bytes(b"\n".join(parts), "text/css") if parts else None
+
+        files = {
+            file.name: Asset.from_bytes(
+                file.data.encode(), file.mime_type or mimetypes.guess_type(file.name)[0] or _DEFAULT_MEDIA_TYPE
+            )
+            for file in ui.files
+        }
+        etag_parts = [b"stylesheet", stylesheet.etag.encode()] if stylesheet else []
+        for name, asset in files.items():
+            etag_parts.extend((name.encode(), asset.etag.encode()))
+        return AssetBundle(stylesheet, files, _etag(*etag_parts))
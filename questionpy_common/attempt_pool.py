@@ -0,0 +1,157 @@
+#  This file is part of QuestionPy. (https://questionpy.org)
+#  QuestionPy is free software released under terms of the MIT license. See LICENSE.md.
+#  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
+"""Pool of attempts which are started ahead of time."""
+
+from collections import deque
+from collections.abc import Iterable
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from threading import Lock
+
+from questionpy_common.api.attempt import AttemptModel
+from questionpy_common.api.question import BaseQuestion
+
+__all__ = ["AttemptPool", "StartedAttempt"]
+
+
+@dataclass(frozen=True)
+class StartedAttempt:
+    """Result of :meth:`BaseQuestion.start_attempt`, exported right away."""
+
+    attempt_state: str
+    attempt: AttemptModel
+
+
+class AttemptPool:
+    """Starts attempts at a question ahead of time, so they are ready when students open the question.
+
+    Call :meth:`prewarm` before a burst of attempts is expected (e.g. when an exam is about to begin) and then use
+    :meth:`take` instead of calling :meth:`BaseQuestion.start_attempt`. When the pool of a variant is empty, the attempt
+    is started synchronously, so :meth:`take` never fails because of the pool.
+
+    If the question declares :attr:`BaseQuestion.deterministic_start_attempt`, a single attempt per variant is started
+    and handed out to everyone. Its model is shared and must not be modified. Otherwise, every started attempt is
+    handed out only once.
+    """
+
+    def __init__(self, question: BaseQuestion, *, size: int = 8, executor: Executor | None = None):
+        """Creates an empty pool.
+
+        Args:
+            question: Question to start attempts at.
+            size: Number of attempts to keep ready per variant. Ignored for deterministic questions.
+            executor: If given, attempts taken from the pool are replaced in the background using this executor.
+        """
+        self.question = question
+        self.num_variants = question.export().num_variants
+        self.size = 1 if question.deterministic_start_attempt else size
+        self._executor = executor
+        self._deterministic = question.deterministic_start_attempt
+        self._ready: dict[int, deque[StartedAttempt]] = {variant: deque() for variant in self._all_variants()}
+        self._refilling: set[int] = set()
+        # Number of attempts per variant which are being started to fill the pool.
+        self._starting: dict[int, int] = dict.fromkeys(self._all_variants(), 0)
+        # Incremented by clear, so that attempts started before are not added afterwards.
+        self._generation = 0
+        self._lock = Lock()
+
+    def _all_variants(self) -> range:
+        return range(1, self.num_variants + 1)
+
+    def _check_variant(self, variant: int) -> None:
+        if variant not in self._ready:
+            msg = f"Variant {variant} does not exist, the question has {self.num_variants} variant(s)."
+            raise ValueError(msg)
+
+    def _start(self, variant: int) -> StartedAttempt:
+        attempt = self.question.start_attempt(variant)
+        return StartedAttempt(attempt_state=attempt.export_attempt_state(), attempt=attempt.export())
+
+    def available(self, variant: int) -> int:
+        """Number of attempts of the given variant that are ready to be taken."""
+        self._check_variant(variant)
+        return len(self._ready[variant])
+
+    def prewarm(self, variants: Iterable[int] | None = None) -> None:
+        """Starts attempts until the pool of each given variant is full.
+
+        Args:
+            variants: Variants to fill the pool for. Defaults to all variants of the question.
+
+        Raises:
+            ValueError: If one of the variants does not exist.
+        """
+        for variant in self._all_variants() if variants is None else variants:
+            self._check_variant(variant)
+            while self._fill_one(variant):
+                pass
+
+    def _fill_one(self, variant: int) -> bool:
+        # Attempts are started outside the lock, but counted as starting, so that concurrent fills don't overfill.
+        with self._lock:
+            if len(self._ready[variant]) + self._starting[variant] >= self.size:
+                return False
+            self._starting[variant] += 1
+            generation = self._generation
+
+        started = None
+        try:
+            started = self._start(variant)
+        finally:
+            with self._lock:
+                if generation == self._generation:
+                    self._starting[variant] -= 1
+                    if started is not None:
+                        self._ready[variant].append(started)
+        return True
+
+    def take(self, variant: int) -> StartedAttempt:
+        """Gets a started attempt of the given variant, starting one synchronously if none is ready.
+
+        Raises:
+            ValueError: If the variant does not exist.
+        """
+        self._check_variant(variant)
+        ready = self._ready[variant]
+        if self._deterministic:
+            self.prewarm((variant,))
+            with self._lock:
+                if ready:
+                    return ready[0]
+            # Another thread is still starting the shared attempt, or the pool was cleared in the meantime.
+            return self._start(variant)
+
+        try:
+            started = ready.popleft()
+        except IndexError:
+            started = self._start(variant)
+        self._schedule_refill(variant)
+        return started
+
+    def _schedule_refill(self, variant: int) -> None:
+        if self._executor is None:
+            return
+        with self._lock:
+            if variant in self._refilling:
+                return
+            self._refilling.add(variant)
+        self._executor.submit(self._refill, variant)
+
+    def _refill(self, variant: int) -> None:
+        try:
+            self.prewarm((variant,))
+        finally:
+            with self._lock:
+                self._refilling.discard(variant)
+
+    def clear(self) -> None:
+        """Discards all attempts that are ready, e.g. after the question has been changed.
+
+        Attempts which are being started while the pool is cleared are discarded as well.
+        """
+        with self._lock:
+            self._generation += 1
+            self._starting = dict.fromkeys(self._all_variants(), 0)
+            for ready in self._ready.values():
+                ready.clear()
@@ -0,0 +1,246 @@
+#  This file is part of QuestionPy. (https://questionpy.org)
+#  QuestionPy is free software released under terms of the MIT license. See LICENSE.md.
+#  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
+"""Compact bitset representation of manifest permissions and tags.
+
+Permission and tag strings are interned into bit positions by a :class:`BitRegistry`. Each manifest is then described by
+a :class:`ManifestBits` holding two integers, and a :class:`ManifestBitsetIndex` keeps one bitmap of packages per
+permission and tag, so that catalog filters are a handful of bitwise operations on arbitrarily large integers.
+"""
+
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from threading import Lock
+
+from questionpy_common.manifest import Manifest
+
+__all__ = ["BitRegistry", "ManifestBits", "ManifestBitsetIndex", "iter_bits"]
+
+_MIN_COMPACTION_SLOTS = 64
+
+
+def iter_bits(mask: int) -> Iterator[int]:
+    """Yields the positions of the set bits of a non-negative integer in ascending order."""
+    while mask:
+        lowest = mask & -mask
+        yield lowest.bit_length() - 1
+        mask ^= lowest
+
+
+class BitRegistry:
+    """Thread-safe interning registry which assigns a stable bit position to each distinct string."""
+
+    def __init__(self, strings: Iterable[str] = ()):
+        self._bits: dict[str, int] = {}
+        self._strings: list[str] = []
+        self._lock = Lock()
+        for string in strings:
+            self.bit(string)
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    def __contains__(self, string: object) -> bool:
+        return string in self._bits
+
+    def bit(self, string: str) -> int:
+        """Gets the bit position of the given string, assigning the next free position if it is new."""
+        bit = self._bits.get(string)
+        if bit is None:
+            with self._lock:
+                bit = self._bits.get(string)
+                if bit is None:
+                    bit = self._bits[string] = len(self._strings)
+                    self._strings.append(string)
+        return bit
+
+    def mask(self, strings: Iterable[str], *, register: bool = True) -> int:
+        """Gets the bitset of the given strings.
+
+        Args:
+            strings: Strings to be included in the bitset.
+            register: Whether to register new strings. If ``False``, unknown strings are left out.
+        """
+        mask = 0
+        for string in strings:
+            if register:
+                mask |= 1 << self.bit(string)
+            elif (bit := self._bits.get(string)) is not None:
+                mask |= 1 << bit
+        return mask
+
+    def strings(self, mask: int) -> frozenset[str]:
+        """Gets the strings contained in the given bitset."""
+        return frozenset(self._strings[bit] for bit in iter_bits(mask))
+
+
+@dataclass(frozen=True, slots=True)
+class ManifestBits:
+    """Permissions and tags of a single package as bitsets."""
+
+    identifier: str
+    permissions: int
+    tags: int
+
+    def requires_only(self, allowed_permissions: int) -> bool:
+        """Whether the package requires no permission outside the given bitset."""
+        return self.permissions & ~allowed_permissions == 0
+
+    def has_all_tags(self, tags: int) -> bool:
+        return self.tags & tags == tags
+
+    def has_any_tag(self, tags: int) -> bool:
+        return self.tags & tags != 0
+
+
+class ManifestBitsetIndex:
+    """Index answering permission and tag queries over many packages with bulk bitwise operations.
+
+    Every package gets a slot number. For each permission and tag, the index keeps an integer whose bit at a slot is
+    set if the package in that slot has the permission or tag.
+    """
+
+    def __init__(
+        self,
+        manifests: Iterable[Manifest] = (),
+        *,
+        permissions: BitRegistry | None = None,
+        tags: BitRegistry | None = None,
+    ):
+        """Creates an index of the given manifests.
+
+        Args:
+            manifests: Initial manifests of the index.
+            permissions: Registry for permission strings. Pass the same registry to share it between indices.
+            tags: Registry for tag strings.
+        """
+        self.permissions = permissions or BitRegistry()
+        self.tags = tags or BitRegistry()
+        self._slots: dict[str, int] = {}
+        self._entries: list[ManifestBits | None] = []
+        self._occupied = 0
+        self._packages_by_permission: dict[int, int] = {}
+        self._packages_by_tag: dict[int, int] = {}
+        for manifest in manifests:
+            self.add(manifest)
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, identifier: object) -> bool:
+        return identifier in self._slots
+
+    def bits_of(self, manifest: Manifest) -> ManifestBits:
+        """Converts the permissions and tags of the manifest to bitsets, registering unknown strings."""
+        return ManifestBits(
+            identifier=manifest.identifier,
+            permissions=self.permissions.mask(manifest.permissions),
+            tags=self.tags.mask(manifest.tags),
+        )
+
+    def add(self, manifest: Manifest) -> ManifestBits:
+        """Adds a manifest to the index, replacing an existing one with the same identifier."""
+        bits = self.bits_of(manifest)
+        self.remove(bits.identifier)
+
+        slot = len(self._entries)
+        self._entries.append(bits)
+        self._slots[bits.identifier] = slot
+        self._occupied |= 1 << slot
+        self._update_columns(bits, slot)
+        return bits
+
+    def remove(self, identifier: str) -> None:
+        """Removes a package from the index. Does nothing if it is not in the index."""
+        slot = self._slots.pop(identifier, None)
+        if slot is None:
+            return
+        bits = self._entries[slot]
+        self._entries[slot] = None
+        self._occupied &= ~(1 << slot)
+        if bits:
+            self._update_columns(bits, slot, remove=True)
+        if len(self._entries) > 2 * len(self._slots) + _MIN_COMPACTION_SLOTS:
+            self._compact()
+
+    def _compact(self) -> None:
+        # Slots of removed packages are only reclaimed here, to keep the bitmaps from growing indefinitely.
+        entries = [bits for bits in self._entries if bits]
+        self._slots = {}
+        self._entries = []
+        self._occupied = 0
+        self._packages_by_permission = {}
+        self._packages_by_tag = {}
+        for slot, bits in enumerate(entries):
+            self._entries.append(bits)
+            self._slots[bits.identifier] = slot
+            self._occupied |= 1 << slot
+            self._update_columns(bits, slot)
+
+    def _update_columns(self, bits: ManifestBits, slot: int, *, remove: bool = False) -> None:
+        slot_bit = 1 << slot
+        for mask, columns in ((bits.permissions, self._packages_by_permission), (bits.tags, self._packages_by_tag)):
+            for bit in iter_bits(mask):
+                columns[bit] = columns.get(bit, 0) & ~slot_bit if remove else columns.get(bit, 0) | slot_bit
+
+    def get(self, identifier: str) -> ManifestBits:
+        """Gets the bitsets of a package.
+
+        Raises:
+            KeyError: If the package is not in the index.
+        """
+        bits = self._entries[self._slots[identifier]]
+        if bits is None:
+            raise KeyError(identifier)
+        return bits
+
+    def _identifiers(self, packages: int) -> list[str]:
+        return [bits.identifier for slot in iter_bits(packages) if (bits := self._entries[slot])]
+
+    def _requiring_only(self, allowed_permissions: Iterable[str]) -> int:
+        allowed = self.permissions.mask(allowed_permissions, register=False)
+        disallowed = 0
+        for bit, packages in self._packages_by_permission.items():
+            if not allowed >> bit & 1:
+                disallowed |= packages
+        return self._occupied & ~disallowed
+
+    def _with_all_tags(self, tags: Iterable[str]) -> int:
+        packages = self._occupied
+        for tag in tags:
+            if tag not in self.tags:
+                return 0
+            packages &= self._packages_by_tag.get(self.tags.bit(tag), 0)
+        return packages
+
+    def _with_any_tag(self, tags: Iterable[str]) -> int:
+        packages = 0
+        for bit in iter_bits(self.tags.mask(tags, register=False)):
+            packages |= self._packages_by_tag.get(bit, 0)
+        return packages
+
+    def filter(
+        self,
+        *,
+        allowed_permissions: Iterable[str] | None = None,
+        all_tags: Iterable[str] | None = None,
+        any_tags: Iterable[str] | None = None,
+    ) -> list[str]:
+        """Finds the packages matching all given criteria.
+
+        Args:
+            allowed_permissions: Only include packages which require no permission outside of these.
+            all_tags: Only include packages which have all of these tags.
+            any_tags: Only include packages which have at least one of these tags.
+
+        Returns:
+            Identifiers of the matching packages, in the order they were added to the index.
+        """
+        packages = self._occupied
+        if allowed_permissions is not None:
+            packages &= self._requiring_only(allowed_permissions)
+        if all_tags is not None:
+            packages &= self._with_all_tags(all_tags)
+        if any_tags is not None:
+            packages &= self._with_any_tag(any_tags)
+        return self._identifiers(packages)
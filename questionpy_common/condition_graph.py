@@ -0,0 +1,277 @@
+#  This file is part of QuestionPy. (https://questionpy.org)
+#  QuestionPy is free software released under terms of the MIT license. See LICENSE.md.
+#  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
+"""Dependency graph of the conditions of a form.
+
+Conditions refer to other elements by name, so the elements of a form and their ``disable_if`` and ``hide_if``
+conditions form a directed graph. It allows renderers to re-evaluate only the conditions which depend on a changed
+input instead of all conditions of the form.
+"""
+
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from questionpy_common.conditions import Condition, DoesNotEqual, Equals, In, IsChecked, IsNotChecked
+from questionpy_common.elements import CanHaveConditions, FormElement, OptionsFormDefinition
+
+__all__ = ["ConditionCycleError", "ConditionEvaluator", "ConditionGraph", "ConditionState", "evaluate_condition"]
+
+_UNCHECKED_VALUES = (None, False, 0, "", "0")
+_TRUE_STRINGS = ("1", "true")
+_FALSE_STRINGS = ("0", "", "false")
+
+
+class ConditionCycleError(Exception):
+    """The conditions of some elements depend on each other."""
+
+    def __init__(self, cycles: list[list[str]]):
+        self.cycles = cycles
+        super().__init__("Conditions contain cycles: " + "; ".join(" -> ".join(cycle) for cycle in cycles))
+
+
+@dataclass(frozen=True)
+class ConditionState:
+    """Current effect of the conditions of an element."""
+
+    disabled: bool = False
+    hidden: bool = False
+
+
+def _iter_elements(elements: Iterable[FormElement]) -> Iterator[FormElement]:
+    for element in elements:
+        yield element
+        yield from _iter_elements(getattr(element, "elements", ()))
+        yield from getattr(element, "checkboxes", ())
+
+
+def _scalars_equal(actual: object, expected: object) -> bool:
+    if isinstance(actual, bool) or isinstance(expected, bool):
+        # Bools only equal bools and the strings the LMS submits for them, not the ints 0 and 1.
+        if type(actual) is type(expected):
+            return actual == expected
+        text, flag = (actual, expected) if isinstance(expected, bool) else (expected, actual)
+        return isinstance(text, str) and text.strip().lower() in (_TRUE_STRINGS if flag else _FALSE_STRINGS)
+    if type(actual) is type(expected):
+        return actual == expected
+    # The LMS submits all values as strings, while conditions may compare to ints.
+    return actual is not None and str(actual) == str(expected)
+
+
+def _values_equal(actual: object, expected: object) -> bool:
+    # The values of multiple-selects are lists, which match if any of the selected values does.
+    if isinstance(actual, list):
+        return any(_scalars_equal(item, expected) for item in actual)
+    return _scalars_equal(actual, expected)
+
+
+def evaluate_condition(condition: Condition, value: object) -> bool:
+    """Checks whether a condition matches the given value of the element it refers to."""
+    if isinstance(condition, IsChecked):
+        return value not in _UNCHECKED_VALUES
+    if isinstance(condition, IsNotChecked):
+        return value in _UNCHECKED_VALUES
+    if isinstance(condition, Equals):
+        return _values_equal(value, condition.value)
+    if isinstance(condition, DoesNotEqual):
+        return not _values_equal(value, condition.value)
+    if isinstance(condition, In):
+        return any(_values_equal(value, expected) for expected in condition.value)
+    msg = f"Unknown condition kind '{condition.kind}'."
+    raise TypeError(msg)
+
+
+class _StronglyConnectedComponents:
+    """Iterative version of Tarjan's algorithm, as forms may be deeper than the recursion limit."""
+
+    def __init__(self, successors: Callable[[str], Iterable[str]]):
+        self._successors = successors
+        self._index: dict[str, int] = {}
+        self._lowlink: dict[str, int] = {}
+        self._stack: list[str] = []
+        self._on_stack: set[str] = set()
+        self._work: list[tuple[str, Iterator[str]]] = []
+
+    def find(self, nodes: Iterable[str]) -> Iterator[list[str]]:
+        for root in nodes:
+            if root in self._index:
+                continue
+            self._visit(root)
+            while self._work:
+                node, successors = self._work[-1]
+                successor = next(successors, None)
+                if successor is None:
+                    if component := self._finish(node):
+                        yield component
+                elif successor not in self._index:
+                    self._visit(successor)
+                elif successor in self._on_stack:
+                    self._lowlink[node] = min(self._lowlink[node], self._index[successor])
+
+    def _visit(self, node: str) -> None:
+        self._index[node] = self._lowlink[node] = len(self._index)
+        self._stack.append(node)
+        self._on_stack.add(node)
+        self._work.append((node, iter(self._successors(node))))
+
+    def _finish(self, node: str) -> list[str] | None:
+        self._work.pop()
+        if self._work:
+            parent = self._work[-1][0]
+            self._lowlink[parent] = min(self._lowlink[parent], self._lowlink[node])
+        if self._lowlink[node] != self._index[node]:
+            return None
+        position = len(self._stack) - self._stack[::-1].index(node) - 1
+        component = self._stack[position:]
+        del self._stack[position:]
+        self._on_stack.difference_update(component)
+        return component
+
+
+class ConditionGraph:
+    """Dependencies between the elements of a form which have conditions and the elements they refer to.
+
+    Elements are identified by their name. The names of elements with conditions must be unique within the form.
+    """
+
+    def __init__(self, elements: Iterable[FormElement]):
+        """Builds the graph from the given elements, including all elements nested in them.
+
+        Raises:
+            ValueError: If two elements with conditions share the same name.
+        """
+        self._elements: dict[str, CanHaveConditions] = {}
+        self._dependencies: dict[str, frozenset[str]] = {}
+        self._dependents: dict[str, set[str]] = {}
+
+        for element in _iter_elements(elements):
+            if not isinstance(element, CanHaveConditions) or not (element.disable_if or element.hide_if):
+                continue
+            if element.name in self._elements:
+                msg = f"Multiple elements with conditions are named '{element.name}'."
+                raise ValueError(msg)
+
+            self._elements[element.name] = element
+            dependencies = frozenset(condition.name for condition in (*element.disable_if, *element.hide_if))
+            self._dependencies[element.name] = dependencies
+            for dependency in dependencies:
+                self._dependents.setdefault(dependency, set()).add(element.name)
+
+    @classmethod
+    def from_definition(cls, definition: OptionsFormDefinition) -> "ConditionGraph":
+        """Builds the graph of all elements of the given form definition."""
+        return cls([*definition.general, *(element for section in definition.sections for element in section.elements)])
+
+    @property
+    def elements(self) -> Mapping[str, CanHaveConditions]:
+        """All elements which have conditions, by name."""
+        return self._elements
+
+    def dependencies(self, name: str) -> frozenset[str]:
+        """Names of the elements the conditions of the given element refer to."""
+        return self._dependencies.get(name, frozenset())
+
+    def dependents(self, name: str) -> frozenset[str]:
+        """Names of the elements with conditions referring directly to the given element."""
+        return frozenset(self._dependents.get(name, ()))
+
+    def transitive_dependents(self, names: Iterable[str]) -> set[str]:
+        """Names of the elements whose conditions depend directly or indirectly on any of the given elements."""
+        result: set[str] = set()
+        pending = list(names)
+        while pending:
+            for dependent in self._dependents.get(pending.pop(), ()):
+                if dependent not in result:
+                    result.add(dependent)
+                    pending.append(dependent)
+        return result
+
+    def find_cycles(self) -> list[list[str]]:
+        """Finds all groups of elements whose conditions depend on each other.
+
+        Returns:
+            The strongly connected components of the graph which contain a cycle, each as a list of element names.
+        """
+        return [
+            component
+            for component in _StronglyConnectedComponents(self.dependencies).find(self._dependencies)
+            if len(component) > 1 or component[0] in self.dependencies(component[0])
+        ]
+
+    def topological_order(self) -> list[str]:
+        """Orders all elements in the graph so that every element comes after the elements its conditions refer to.
+
+        Raises:
+            ConditionCycleError: If the conditions contain cycles.
+        """
+        remaining = {name: len(dependencies) for name, dependencies in self._dependencies.items()}
+        ready = [name for name in self._dependents if name not in remaining]
+        ready.extend(name for name, count in remaining.items() if count == 0)
+        order = []
+
+        while ready:
+            name = ready.pop()
+            order.append(name)
+            for dependent in self._dependents.get(name, ()):
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    ready.append(dependent)
+
+        if len(order) != len(self._dependents.keys() | self._dependencies.keys()):
+            raise ConditionCycleError(self.find_cycles())
+        return order
+
+
+class ConditionEvaluator:
+    """Keeps track of the condition states of a form while its inputs change.
+
+    After the initial evaluation, :meth:`update` only re-evaluates the conditions of the elements which refer to the
+    changed inputs.
+    """
+
+    def __init__(self, graph: ConditionGraph, values: Mapping[str, Any] | None = None):
+        """Evaluates all conditions for the given initial values.
+
+        Args:
+            graph: Graph of the form.
+            values: Current values of the inputs by name. Missing inputs are treated as empty.
+        """
+        self.graph = graph
+        self._values: dict[str, Any] = dict(values or {})
+        self._states = {name: self._evaluate(name) for name in graph.elements}
+
+    def _evaluate(self, name: str) -> ConditionState:
+        element = self.graph.elements[name]
+        values = self._values
+        return ConditionState(
+            disabled=any(evaluate_condition(condition, values.get(condition.name)) for condition in element.disable_if),
+            hidden=any(evaluate_condition(condition, values.get(condition.name)) for condition in element.hide_if),
+        )
+
+    @property
+    def states(self) -> Mapping[str, ConditionState]:
+        """Current state of every element with conditions, by name."""
+        return self._states
+
+    def state(self, name: str) -> ConditionState:
+        """Current state of the given element. Elements without conditions are always enabled and visible."""
+        return self._states.get(name, ConditionState())
+
+    def update(self, changes: Mapping[str, Any]) -> dict[str, ConditionState]:
+        """Applies changed input values and re-evaluates the conditions depending on them.
+
+        Returns:
+            New states of the elements whose state changed, by name.
+        """
+        affected: set[str] = set()
+        for name, value in changes.items():
+            if self._values.get(name) != value:
+                self._values[name] = value
+                affected.update(self.graph.dependents(name))
+
+        changed = {}
+        for name in affected:
+            state = self._evaluate(name)
+            if state != self._states[name]:
+                self._states[name] = changed[name] = state
+        return changed
@@ -1,12 +1,17 @@
 #  This file is part of QuestionPy. (https://questionpy.org)
 #  QuestionPy is free software released under terms of the MIT license. See LICENSE.md.
 #  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
+import itertools
 import random
+from collections import deque
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
 
 from polyfactory import Use
 from polyfactory.factories.pydantic_factory import ModelFactory as _ModelFactory
 
 import questionpy_common.elements as _elements
+from questionpy_common.conditions import Condition, DoesNotEqual, Equals, In, IsChecked, IsNotChecked
 
 
 class StaticTextElementFactory(_ModelFactory):
@@ -31,10 +36,12 @@ class OptionFactory(_ModelFactory):
 
 class RadioGroupElementFactory(_ModelFactory):
     __model__ = _elements.RadioGroupElement
+    options = Use(OptionFactory.batch, 3)
 
 
 class SelectElementFactory(_ModelFactory):
     __model__ = _elements.SelectElement
+    options = Use(OptionFactory.batch, 3)
 
 
 class HiddenElementFactory(_ModelFactory):
@@ -77,3 +84,220 @@ class OptionsFormDefinitionFactory(_ModelFactory):
 
     general = Use(_one_of_each_element)
     sections = Use(lambda: [FormSectionFactory.build()])
+
+
+class RepetitionElementFactory(_ModelFactory):
+    __model__ = _elements.RepetitionElement
+
+    elements = Use(_one_of_each_element)
+
+
+@dataclass(frozen=True)
+class FormGeneratorOptions:
+    """Shape of the forms produced by :class:`FormGenerator`."""
+
+    depth: int = 2
+    """Maximum nesting depth of groups and repetitions. 0 disables nested elements altogether."""
+    fan_out: int = 5
+    """Number of child elements in each group, repetition and section."""
+    container_probability: float = 0.2
+    """Probability that an element is a group or repetition, as long as `depth` has not been reached."""
+    repetition_probability: float = 0.5
+    """Probability that a generated container is a repetition instead of a group."""
+    num_options: int = 4
+    """Number of options in each radio group and select element."""
+    condition_density: float = 0.3
+    """Probability that an element gets a `disable_if` or `hide_if` condition on a previously generated element."""
+    initial_repetitions: int = 3
+    """Value of `initial_repetitions` of the generated repetitions."""
+    condition_targets: int = 64
+    """Number of most recently generated elements which conditions may refer to."""
+
+
+class FormGenerator:
+    """Seeded generator of arbitrarily large and deeply nested forms.
+
+    Unlike the polyfactory-based factories above, elements are built directly and yielded one by one, which makes it
+    possible to stream millions of elements into a validator or renderer without keeping them in memory. Two
+    generators with the same seed and options produce identical forms.
+
+    Element names are unique within the generated form. Conditions only ever refer to elements generated before the
+    conditioned element and its children, and never to elements inside a repetition from outside of it.
+    """
+
+    def __init__(self, seed: int | None = None, options: FormGeneratorOptions | None = None):
+        self.options = options or FormGeneratorOptions()
+        self._random = random.Random(seed)
+        self._counter = itertools.count()
+        self._targets: deque[_elements.FormElement] = deque(maxlen=self.options.condition_targets)
+
+    def iter_elements(self, count: int | None = None) -> Iterator[_elements.FormElement]:
+        """Lazily generates top-level form elements.
+
+        Args:
+            count: Number of top-level elements to generate, or ``None`` to generate elements indefinitely.
+        """
+        indices = itertools.count() if count is None else range(count)
+        for _ in indices:
+            yield self._element(self.options.depth)
+
+    def iter_sections(self, count: int | None = None) -> Iterator[_elements.FormSection]:
+        """Lazily generates form sections with `fan_out` elements each.
+
+        Args:
+            count: Number of sections to generate, or ``None`` to generate sections indefinitely.
+        """
+        indices = itertools.count() if count is None else range(count)
+        for _ in indices:
+            name = self._name("section")
+            yield _elements.FormSection(
+                name=name, header=f"Header of {name}", elements=list(self.iter_elements(self.options.fan_out))
+            )
+
+    def build(self, num_general: int, num_sections: int = 0) -> _elements.OptionsFormDefinition:
+        """Builds a complete form definition.
+
+        Args:
+            num_general: Number of top-level elements in the main section.
+            num_sections: Number of additional sections.
+        """
+        return _elements.OptionsFormDefinition(
+            general=list(self.iter_elements(num_general)), sections=list(self.iter_sections(num_sections))
+        )
+
+    def _name(self, prefix: str) -> str:
+        return f"{prefix}_{next(self._counter)}"
+
+    def _children(self, depth: int) -> list[_elements.FormElement]:
+        return [self._element(depth) for _ in range(self.options.fan_out)]
+
+    def _conditions(self) -> list[Condition]:
+        if not self._targets or self._random.random() >= self.options.condition_density:
+            return []
+
+        target = self._random.choice(self._targets)
+        if isinstance(target, _elements.CheckboxElement):
+            return [self._random.choice((IsChecked, IsNotChecked))(name=target.name)]
+        if isinstance(target, _elements.RadioGroupElement | _elements.SelectElement):
+            values = [option.value for option in target.options]
+            if self._random.getrandbits(1):
+                return [In(name=target.name, value=self._random.sample(values, min(2, len(values))))]
+            return [self._random.choice((Equals, DoesNotEqual))(name=target.name, value=self._random.choice(values))]
+        return [DoesNotEqual(name=target.name, value="")]
+
+    def _options(self, name: str) -> list[_elements.Option]:
+        selected = self._random.randrange(self.options.num_options) if self.options.num_options else -1
+        return [
+            _elements.Option(label=f"Option {i} of {name}", value=f"{name}_{i}", selected=i == selected)
+            for i in range(self.options.num_options)
+        ]
+
+    def _element(self, depth: int) -> _elements.FormElement:
+        if depth > 0 and self._random.random() < self.options.container_probability:
+            if self._random.random() < self.options.repetition_probability:
+                return self._repetition(depth)
+            return self._group(depth)
+
+        builder = self._random.choice(self._leaf_builders)
+        return builder(self)
+
+    def _repetition(self, depth: int) -> _elements.RepetitionElement:
+        name = self._name("repetition")
+        # The names of elements in a repetition are indexed per row when submitted, so only elements in the same
+        # repetition may refer to them.
+        outer_targets = self._targets.copy()
+        children = self._children(depth - 1)
+        self._targets = outer_targets
+        return _elements.RepetitionElement(
+            name=name, initial_repetitions=self.options.initial_repetitions, increment=1, elements=children
+        )
+
+    def _group(self, depth: int) -> _elements.GroupElement:
+        name = self._name("group")
+        # The conditions are drawn before the children exist, so a group never depends on its own elements.
+        disable_if = self._conditions()
+        hide_if = self._conditions()
+        return _elements.GroupElement(
+            name=name,
+            label=f"Label of {name}",
+            elements=self._children(depth - 1),
+            disable_if=disable_if,
+            hide_if=hide_if,
+        )
+
+    def _static_text(self) -> _elements.StaticTextElement:
+        name = self._name("static_text")
+        return _elements.StaticTextElement(
+            name=name, label=f"Label of {name}", text=f"Text of {name}", hide_if=self._conditions()
+        )
+
+    def _text_input(self) -> _elements.TextInputElement:
+        name = self._name("input")
+        element = _elements.TextInputElement(
+            name=name, label=f"Label of {name}", disable_if=self._conditions(), hide_if=self._conditions()
+        )
+        self._targets.append(element)
+        return element
+
+    def _checkbox(self) -> _elements.CheckboxElement:
+        name = self._name("checkbox")
+        element = _elements.CheckboxElement(
+            name=name, left_label=f"Label of {name}", disable_if=self._conditions(), hide_if=self._conditions()
+        )
+        self._targets.append(element)
+        return element
+
+    def _checkbox_group(self) -> _elements.CheckboxGroupElement:
+        return _elements.CheckboxGroupElement(
+            name=self._name("checkbox_group"),
+            checkboxes=[
+                _elements.CheckboxElement(name=self._name("checkbox"), right_label=f"Checkbox {i}")
+                for i in range(self.options.fan_out)
+            ],
+        )
+
+    def _radio_group(self) -> _elements.RadioGroupElement:
+        name = self._name("radio_group")
+        element = _elements.RadioGroupElement(
+            name=name,
+            label=f"Label of {name}",
+            options=self._options(name),
+            disable_if=self._conditions(),
+            hide_if=self._conditions(),
+        )
+        self._targets.append(element)
+        return element
+
+    def _select(self) -> _elements.SelectElement:
+        name = self._name("select")
+        element = _elements.SelectElement(
+            name=name,
+            label=f"Label of {name}",
+            multiple=self._random.getrandbits(1) == 1,
+            options=self._options(name),
+            disable_if=self._conditions(),
+            hide_if=self._conditions(),
+        )
+        self._targets.append(element)
+        return element
+
+    def _hidden(self) -> _elements.HiddenElement:
+        name = self._name("hidden")
+        return _elements.HiddenElement(name=name, value=f"Value of {name}", disable_if=self._conditions())
+
+    _leaf_builders: tuple[Callable[["FormGenerator"], _elements.FormElement], ...] = (
+        _static_text,
+        _text_input,
+        _checkbox,
+        _checkbox_group,
+        _radio_group,
+        _select,
+        _hidden,
+    )
+
+
+def iter_form_elements(
+    count: int | None = None, *, seed: int | None = None, options: FormGeneratorOptions | None = None
+) -> Iterator[_elements.FormElement]:
+    """Shorthand for :meth:`FormGenerator.iter_elements` on a new generator."""
+    return FormGenerator(seed, options).iter_elements(count)
@@ -0,0 +1,84 @@
+#  This file is part of QuestionPy. (https://questionpy.org)
+#  QuestionPy is free software released under terms of the MIT license. See LICENSE.md.
+#  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
+"""Compares the size and speed of the wire codecs.
+
+Run with ``python -m questionpy_common.dev.wire_benchmark``.
+"""
+
+import sys
+import timeit
+from dataclasses import dataclass
+from functools import partial
+
+from pydantic import BaseModel
+
+from questionpy_common.api.attempt import AttemptScoredModel, AttemptUi, ScoringCode, UiFile
+from questionpy_common.dev.factories import FormGenerator
+from questionpy_common.wire import JsonCodec, MsgpackCodec, WireCodec, supported_media_types
+
+__all__ = ["BenchmarkResult", "benchmark_wire_codecs", "sample_models"]
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    sample: str
+    codec: str
+    size: int
+    """Size of the encoded sample in bytes."""
+    encode_seconds: float
+    """Average time to encode the sample."""
+    decode_seconds: float
+    """Average time to decode and validate the sample."""
+
+
+def sample_models() -> dict[str, BaseModel]:
+    """Returns the models used by :func:`benchmark_wire_codecs`: a large form and an attempt with big files."""
+    return {
+        "form": FormGenerator(seed=0).build(200, 10),
+        "attempt": AttemptScoredModel(
+            variant=1,
+            ui=AttemptUi(
+                content="<div>" + "<p>Question text</p>" * 500 + "</div>",
+                files=[
+                    UiFile(name=f"image_{i}.svg", data="<svg/>" * 5000, mime_type="image/svg+xml") for i in range(5)
+                ],
+            ),
+            scoring_code=ScoringCode.AUTOMATICALLY_SCORED,
+            score=0.5,
+        ),
+    }
+
+
+def _codecs() -> list[WireCodec]:
+    codecs: list[WireCodec] = [JsonCodec()]
+    if MsgpackCodec.media_type in supported_media_types():
+        codecs.append(MsgpackCodec("0.1"))
+    return codecs
+
+
+def benchmark_wire_codecs(number: int = 20) -> list[BenchmarkResult]:
+    """Encodes and decodes each sample model `number` times with each available codec."""
+    results = []
+    for sample, model in sample_models().items():
+        for codec in _codecs():
+            data = codec.encode(model)
+            results.append(
+                BenchmarkResult(
+                    sample=sample,
+                    codec=type(codec).__name__,
+                    size=len(data),
+                    encode_seconds=timeit.timeit(partial(codec.encode, model), number=number) / number,
+                    decode_seconds=timeit.timeit(partial(codec.decode, type(model), data), number=number) / number,
+                )
+            )
+    return results
+
+
+if __name__ == "__main__":
+    sys.stdout.write(f"{'sample':<10}{'codec':<15}{'bytes':>10}{'encode ms':>12}{'decode ms':>12}\n")
+    for result in benchmark_wire_codecs():
+        sys.stdout.write(
+            f"{result.sample:<10}{result.codec:<15}{result.size:>10}"
+            f"{result.encode_seconds * 1000:>12.3f}{result.decode_seconds * 1000:>12.3f}\n"
+        )
@@ -2,9 +2,13 @@
 #  QuestionPy is free software released under terms of the MIT license. See LICENSE.md.
 #  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
 
-from typing import Annotated, Literal, TypeAlias, TypeGuard, get_args
+import sys
+import weakref
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import Annotated, Any, Literal, TypeAlias, TypeGuard, get_args, overload
 
-from pydantic import BaseModel, Field, PositiveInt
+from pydantic import BaseModel, Field, GetCoreSchemaHandler, GetPydanticSchema, PositiveInt
+from pydantic_core import core_schema
 
 from questionpy_common.conditions import Condition
 
@@ -17,6 +21,7 @@ __all__ = [
     "GroupElement",
     "HiddenElement",
     "Option",
+    "OptionList",
     "OptionsFormDefinition",
     "RadioGroupElement",
     "RepetitionElement",
@@ -102,11 +107,181 @@ class Option(BaseModel):
     """Default state of the option."""
 
 
+class OptionList(Sequence[Option]):
+    """Immutable, compact sequence of options.
+
+    Instead of one model per option, only the interned labels and values and the indices of the selected options are
+    stored. It can be passed as the ``options`` of :class:`RadioGroupElement` and :class:`SelectElement` instead of a
+    list, which it serializes exactly like. Use :meth:`shared` so that long lists which repeat across sections or
+    repetitions are only stored once.
+
+    :class:`Option` instances are created on every access, so changing them does not change the list. To change the
+    options of an element, assign a new list to ``options``.
+    """
+
+    __slots__ = ("__weakref__", "_hash", "_labels", "_selected", "_value_indices", "_values")
+
+    _shared: "weakref.WeakValueDictionary[OptionList, OptionList]" = weakref.WeakValueDictionary()
+
+    def __init__(self, options: Iterable[Option | Mapping[str, Any]] = ()):
+        """Creates an option list.
+
+        Args:
+            options: The options. Mappings, e.g. serialized options, are used without validation.
+        """
+        labels = []
+        values = []
+        selected = []
+        for index, option in enumerate(options):
+            if isinstance(option, Option):
+                label, value, is_selected = option.label, option.value, option.selected
+            else:
+                label, value, is_selected = option["label"], option["value"], option.get("selected", False)
+            labels.append(sys.intern(label))
+            values.append(sys.intern(value))
+            if is_selected:
+                selected.append(index)
+
+        self._labels = tuple(labels)
+        self._values = tuple(values)
+        self._selected = frozenset(selected)
+        self._value_indices: dict[str, int] | None = None
+        self._hash = hash(self._key())
+
+    @classmethod
+    def shared(cls, options: "Iterable[Option | Mapping[str, Any]] | OptionList") -> "OptionList":
+        """Returns an option list with the given options, reusing an existing equal instance if there is one."""
+        option_list = options if isinstance(options, OptionList) else cls(options)
+        return cls._shared.setdefault(option_list, option_list)
+
+    @property
+    def labels(self) -> tuple[str, ...]:
+        return self._labels
+
+    @property
+    def values(self) -> tuple[str, ...]:
+        return self._values
+
+    @property
+    def selected_indices(self) -> frozenset[int]:
+        return self._selected
+
+    @property
+    def selected_values(self) -> list[str]:
+        """Values of the selected options in order."""
+        return [self._values[index] for index in sorted(self._selected)]
+
+    def has_value(self, value: str) -> bool:
+        """Returns whether one of the options has the given value. Takes constant time."""
+        return value in self._indices()
+
+    def index_of_value(self, value: str) -> int:
+        """Returns the index of the first option with the given value.
+
+        Raises:
+            ValueError: If no option has the value.
+        """
+        index = self._indices().get(value)
+        if index is None:
+            msg = f"No option has the value '{value}'."
+            raise ValueError(msg)
+        return index
+
+    def _key(self) -> tuple[tuple[str, ...], tuple[str, ...], frozenset[int]]:
+        return self._labels, self._values, self._selected
+
+    def _indices(self) -> dict[str, int]:
+        # Built on first use, since most option lists are only serialized.
+        if self._value_indices is None:
+            indices: dict[str, int] = {}
+            for index, value in enumerate(self._values):
+                indices.setdefault(value, index)
+            self._value_indices = indices
+        return self._value_indices
+
+    def _option(self, index: int) -> Option:
+        return Option.model_construct(
+            label=self._labels[index], value=self._values[index], selected=index in self._selected
+        )
+
+    @overload
+    def __getitem__(self, index: int) -> Option: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "OptionList": ...
+
+    def __getitem__(self, index: int | slice) -> "Option | OptionList":
+        if isinstance(index, slice):
+            return OptionList(self._option(position) for position in range(len(self))[index])
+        return self._option(range(len(self))[index])
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self) -> Iterator[Option]:
+        return map(self._option, range(len(self)))
+
+    def __contains__(self, option: object) -> bool:
+        if not isinstance(option, Option) or not self.has_value(option.value):
+            return False
+        return any(candidate == option for candidate in self)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, OptionList):
+            return self._hash == other._hash and self._key() == other._key()
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return len(self) == len(other) and all(option == item for option, item in zip(self, other, strict=True))
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"OptionList({list(self)!r})"
+
+    def _serialize(self, *, omit_unselected: bool) -> list[dict[str, Any]]:
+        # The same as serializing a list of the options, but without creating them.
+        options = []
+        for index, (label, value) in enumerate(zip(self._labels, self._values, strict=True)):
+            option: dict[str, Any] = {"label": label, "value": value}
+            if index in self._selected or not omit_unselected:
+                option["selected"] = index in self._selected
+            options.append(option)
+        return options
+
+
+def _options_schema(_source: Any, handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+    # Lists are validated and serialized as usual. Option lists are kept as they are, and serialized like lists.
+    list_schema = handler.generate_schema(list[Option])
+
+    def validate(value: Any, validate_list: core_schema.ValidatorFunctionWrapHandler) -> list[Option] | OptionList:
+        return value if isinstance(value, OptionList) else validate_list(value)
+
+    def serialize(
+        value: list[Option] | OptionList,
+        serialize_list: core_schema.SerializerFunctionWrapHandler,
+        info: core_schema.SerializationInfo,
+    ) -> Any:
+        if isinstance(value, OptionList):
+            # Option lists don't track which fields were set. Since unselected is the default, it is the one left out.
+            return value._serialize(omit_unselected=info.exclude_unset or info.exclude_defaults)
+        return serialize_list(value)
+
+    return core_schema.no_info_wrap_validator_function(
+        validate,
+        list_schema,
+        serialization=core_schema.wrap_serializer_function_ser_schema(serialize, info_arg=True, schema=list_schema),
+    )
+
+
+_Options: TypeAlias = Annotated[list[Option] | OptionList, GetPydanticSchema(_options_schema)]
+
+
 class RadioGroupElement(_BaseElement, _Labelled, CanHaveConditions, CanHaveHelp):
     """Group of radio buttons, of which at most one can be selected at a time."""
 
     kind: Literal["radio_group"] = "radio_group"
-    options: list[Option]
+    options: _Options
     """Selectable options."""
     required: bool = False
     """Require one of the options to be selected before the form can be submitted."""
@@ -118,7 +293,7 @@ class SelectElement(_BaseElement, _Labelled, CanHaveConditions, CanHaveHelp):
     kind: Literal["select"] = "select"
     multiple: bool = False
     """Allow the selection of multiple options."""
-    options: list[Option]
+    options: _Options
     """Selectable options."""
     required: bool = False
     """Require at least one of the options to be selected before the form can be submitted."""
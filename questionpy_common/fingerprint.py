@@ -0,0 +1,168 @@
+#  This file is part of QuestionPy. (https://questionpy.org)
+#  QuestionPy is free software released under terms of the MIT license. See LICENSE.md.
+#  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
+"""Structural fingerprints of model trees, for use as cache keys.
+
+The fingerprint of a model is a hash of its type and the canonical encoding of its fields, in which nested models are
+represented by their own fingerprint (a Merkle hash). Structurally equal models therefore have equal fingerprints, and
+the order of the items of dicts and sets does not matter.
+
+:func:`fingerprint` hashes the whole tree on every call. A :class:`Fingerprinter` memoizes fingerprints per model
+instance instead, so the fingerprint of a tree whose subtrees have already been fingerprinted, e.g. a form created with
+:meth:`BaseModel.model_copy` in which only one element was replaced, only hashes the nodes on the path to the replaced
+element. Since models are mutable, this requires that fingerprinted models are not mutated afterwards. After mutating
+a model anyway, the root of its tree has to be passed to :meth:`Fingerprinter.invalidate`.
+"""
+
+import hashlib
+import weakref
+from collections.abc import Callable
+from enum import Enum
+from functools import cache
+from typing import Any, Final
+
+from pydantic import BaseModel
+
+from questionpy_common.elements import Option, OptionList
+
+__all__ = ["FINGERPRINT_SIZE", "Fingerprinter", "fingerprint"]
+
+FINGERPRINT_SIZE: Final[int] = 16
+"""Size of fingerprints in bytes."""
+
+_Encoder = Callable[[Any, list[bytes]], None]
+
+
+@cache
+def _layout(model: type[BaseModel]) -> tuple[bytes, tuple[str, ...]]:
+    # The type and field names are the same for all instances, so they are encoded once as a header.
+    names = tuple(model.model_fields)
+    return f"{model.__module__}.{model.__qualname__}({','.join(names)})".encode(), names
+
+
+class Fingerprinter:
+    """Computes fingerprints and memoizes them until the models are garbage collected or invalidated."""
+
+    def __init__(self) -> None:
+        # Models are unhashable, so they are identified by their id. The weak reference removes the entry when the model
+        # is garbage collected, before the id can be reused.
+        self._memo: dict[int, tuple[weakref.ref[BaseModel], bytes]] = {}
+        self._encoders: dict[type, _Encoder] = {
+            type(None): lambda _, parts: parts.append(b"N"),
+            bool: lambda value, parts: parts.append(b"T" if value else b"F"),
+            int: lambda value, parts: parts.append(b"i%d;" % value),
+            float: lambda value, parts: parts.append(b"f%r;" % value),
+            str: self._encode_str,
+            bytes: self._encode_bytes,
+            list: self._encode_sequence,
+            tuple: self._encode_sequence,
+            set: self._encode_set,
+            frozenset: self._encode_set,
+            dict: self._encode_dict,
+            OptionList: self._encode_option_list,
+        }
+
+    def __len__(self) -> int:
+        """Returns the number of memoized fingerprints."""
+        return len(self._memo)
+
+    def __call__(self, model: BaseModel) -> bytes:
+        """Returns the fingerprint of a model.
+
+        Raises:
+            TypeError: If a field contains a value of an unsupported type.
+        """
+        key = id(model)
+        entry = self._memo.get(key)
+        if entry is not None and entry[0]() is model:
+            return entry[1]
+
+        values = model.__dict__
+        digest = self._digest(type(model), [values[name] for name in _layout(type(model))[1]])
+        self._memo[key] = (weakref.ref(model, lambda _: self._memo.pop(key, None)), digest)
+        return digest
+
+    def invalidate(self, root: BaseModel) -> None:
+        """Forgets the memoized fingerprints of a model and all models nested in it.
+
+        Since the fingerprint of a model depends on those of its ancestors, pass the root of the tree after mutating any
+        model in it, e.g. the form definition after appending an element to one of its sections.
+        """
+        pending: list[Any] = [root]
+        while pending:
+            value = pending.pop()
+            if isinstance(value, BaseModel):
+                self._memo.pop(id(value), None)
+                pending.extend(value.__dict__.values())
+            elif isinstance(value, list | tuple | set | frozenset):
+                pending.extend(value)
+            elif isinstance(value, dict):
+                pending.extend(value.values())
+
+    def _digest(self, model: type[BaseModel], values: list[Any]) -> bytes:
+        parts = [_layout(model)[0]]
+        for value in values:
+            self._encode(value, parts)
+        return hashlib.blake2b(b"".join(parts), digest_size=FINGERPRINT_SIZE).digest()
+
+    def _encode(self, value: Any, parts: list[bytes]) -> None:
+        if type(value) is str:
+            # By far the most common type, so it is handled without a lookup.
+            encoded = value.encode()
+            parts.extend((b"s%d:" % len(encoded), encoded))
+            return
+
+        encoder = self._encoders.get(type(value))
+        if encoder is not None:
+            encoder(value, parts)
+        elif isinstance(value, BaseModel):
+            parts.extend((b"m", self(value)))
+        elif isinstance(value, Enum):
+            parts.append(b"e")
+            self._encode(value.value, parts)
+        else:
+            msg = f"Can not fingerprint values of type '{type(value).__name__}'."
+            raise TypeError(msg)
+
+    @staticmethod
+    def _encode_str(value: str, parts: list[bytes]) -> None:
+        encoded = value.encode()
+        parts.extend((b"s%d:" % len(encoded), encoded))
+
+    @staticmethod
+    def _encode_bytes(value: bytes, parts: list[bytes]) -> None:
+        parts.extend((b"b%d:" % len(value), value))
+
+    def _encode_sequence(self, value: list | tuple, parts: list[bytes]) -> None:
+        parts.append(b"l%d;" % len(value))
+        for item in value:
+            self._encode(item, parts)
+
+    def _encode_option_list(self, value: OptionList, parts: list[bytes]) -> None:
+        # Encoded like a list of the options, without creating them.
+        parts.append(b"l%d;" % len(value))
+        selected = value.selected_indices
+        for index, (label, option_value) in enumerate(zip(value.labels, value.values, strict=True)):
+            parts.extend((b"m", self._digest(Option, [label, option_value, index in selected])))
+
+    def _encode_items(self, value: Any) -> bytes:
+        parts: list[bytes] = []
+        self._encode(value, parts)
+        return b"".join(parts)
+
+    def _encode_set(self, value: set | frozenset, parts: list[bytes]) -> None:
+        parts.append(b"S%d;" % len(value))
+        parts.extend(sorted(map(self._encode_items, value)))
+
+    def _encode_dict(self, value: dict, parts: list[bytes]) -> None:
+        parts.append(b"d%d;" % len(value))
+        parts.extend(sorted(self._encode_items(key) + self._encode_items(item) for key, item in value.items()))
+
+
+def fingerprint(model: BaseModel) -> bytes:
+    """Returns the fingerprint of a model, without memoizing it across calls.
+
+    Raises:
+        TypeError: If a field contains a value of an unsupported type.
+    """
+    return Fingerprinter()(model)
@@ -0,0 +1,251 @@
+#  This file is part of QuestionPy. (https://questionpy.org)
+#  QuestionPy is free software released under terms of the MIT license. See LICENSE.md.
+#  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
+"""Conversion between flat LMS form data and the nested form data passed to packages.
+
+The LMS submits form data as flat, bracketed keys such as ``my_section[my_repetition][2][my_input]``. Packages receive
+the same data nested according to the :class:`OptionsFormDefinition`:
+
+- Elements in ``general`` are top-level keys, sections and groups are nested dictionaries keyed by their name.
+- Repetitions are lists with one dictionary per repetition.
+- Selects with ``multiple`` set are lists of the selected values.
+- The checkboxes of a checkbox group belong to the container of the group, as the group only adds a button.
+- Static texts do not have any data.
+"""
+
+import re
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any
+
+from questionpy_common.elements import (
+    CheckboxGroupElement,
+    FormElement,
+    GroupElement,
+    OptionsFormDefinition,
+    RepetitionElement,
+    SelectElement,
+    StaticTextElement,
+)
+
+__all__ = ["FormDataCodec"]
+
+_SUBSCRIPT = re.compile(r"\[([^\[\]]*)\]")
+
+
+class _NodeKind(Enum):
+    VALUE = 0
+    MULTIPLE = 1
+    NESTED = 2
+    REPEATED = 3
+
+
+@dataclass
+class _Node:
+    kind: _NodeKind
+    children: dict[str, "_Node"] = field(default_factory=dict)
+    initial_repetitions: int = 0
+
+
+def _compile(elements: Iterable[FormElement]) -> dict[str, _Node]:
+    nodes: dict[str, _Node] = {}
+    for element in elements:
+        if isinstance(element, StaticTextElement):
+            continue
+        if isinstance(element, CheckboxGroupElement):
+            nodes.update(_compile(element.checkboxes))
+        elif isinstance(element, GroupElement):
+            nodes[element.name] = _Node(_NodeKind.NESTED, _compile(element.elements))
+        elif isinstance(element, RepetitionElement):
+            nodes[element.name] = _Node(_NodeKind.REPEATED, _compile(element.elements), element.initial_repetitions)
+        elif isinstance(element, SelectElement) and element.multiple:
+            nodes[element.name] = _Node(_NodeKind.MULTIPLE)
+        else:
+            nodes[element.name] = _Node(_NodeKind.VALUE)
+    return nodes
+
+
+def _parse_key(key: str) -> list[str] | None:
+    bracket = key.find("[")
+    if bracket < 0:
+        return [key]
+    subscripts = _SUBSCRIPT.findall(key, bracket)
+    # Anything which isn't a clean sequence of subscripts (e.g. 'a[b]c') is not a key we could have generated.
+    if bracket + sum(len(subscript) + 2 for subscript in subscripts) != len(key):
+        return None
+    return [key[:bracket], *subscripts]
+
+
+def _parse_index(segment: str, key: str) -> int:
+    try:
+        index = int(segment)
+    except ValueError:
+        index = -1
+    if index < 0:
+        msg = f"Invalid index '{segment}' in form data key '{key}'."
+        raise ValueError(msg)
+    return index
+
+
+def _appended(by_index: dict[tuple[int, int], Any]) -> tuple[int, int]:
+    # Multiple-select values are keyed by (0, index) if they have an index and by (1, n) otherwise, so that appended
+    # values can neither overwrite nor be overwritten by indexed ones. The size only grows, so n is always unique.
+    return 1, len(by_index)
+
+
+class FormDataCodec:
+    """Converts form data of a specific form definition between the flat and the nested format.
+
+    The definition is compiled into a lookup tree once, so a single codec should be reused for all submissions of the
+    same form. Keys which do not belong to any element of the definition are ignored.
+    """
+
+    def __init__(self, definition: OptionsFormDefinition):
+        self._root = _Node(_NodeKind.NESTED, _compile(definition.general))
+        for section in definition.sections:
+            self._root.children[section.name] = _Node(_NodeKind.NESTED, _compile(section.elements))
+
+    def flatten(self, data: Mapping[str, Any]) -> Iterator[tuple[str, Any]]:
+        """Lazily converts nested form data to flat key-value pairs.
+
+        Args:
+            data: Nested form data, as passed to :meth:`BaseQuestionType.create_question_from_options`.
+        """
+        return self._flatten(self._root.children, data, "")
+
+    def _flatten(self, nodes: dict[str, _Node], data: Mapping[str, Any], prefix: str) -> Iterator[tuple[str, Any]]:
+        for name, value in data.items():
+            node = nodes.get(name)
+            if node is None:
+                continue
+            key = f"{prefix}[{name}]" if prefix else name
+            if node.kind is _NodeKind.VALUE:
+                yield key, value
+            elif node.kind is _NodeKind.MULTIPLE:
+                for index, item in enumerate(value):
+                    yield f"{key}[{index}]", item
+            elif node.kind is _NodeKind.NESTED:
+                yield from self._flatten(node.children, value, key)
+            else:
+                for index, repetition in enumerate(value):
+                    yield from self._flatten(node.children, repetition, f"{key}[{index}]")
+
+    def unflatten(self, data: Mapping[str, Any] | Iterable[tuple[str, Any]]) -> dict[str, Any]:
+        """Converts flat form data to nested form data.
+
+        Repetition and multiple-select indices need neither be contiguous nor ordered, the resulting lists are ordered
+        by index. Multiple-select values without an index (``name[]`` or the bare ``name``, whose value may also be a
+        list) follow the indexed ones in the order they were submitted.
+
+        Args:
+            data: Flat key-value pairs, e.g. an LMS submission.
+
+        Raises:
+            ValueError: If the index of a repetition or multiple-select is not a non-negative integer.
+        """
+        items = data.items() if isinstance(data, Mapping) else data
+        result: dict[str, Any] = {}
+        # Repetitions and multiple-selects are collected into {index: value} dicts first, which are converted to lists
+        # once all items are known.
+        indexed: list[tuple[dict[str, Any], str]] = []
+
+        for key, value in items:
+            segments = _parse_key(key)
+            if segments is None:
+                continue
+            self._insert(result, indexed, segments, value, key)
+
+        for container, name in indexed:
+            by_index = container[name]
+            container[name] = [by_index[index] for index in sorted(by_index)]
+        return result
+
+    def _insert(
+        self,
+        result: dict[str, Any],
+        indexed: list[tuple[dict[str, Any], str]],
+        segments: list[str],
+        value: Any,
+        key: str,
+    ) -> None:
+        nodes = self._root.children
+        container = result
+        position = 0
+        while position < len(segments):
+            name = segments[position]
+            node = nodes.get(name)
+            if node is None:
+                return
+            position += 1
+
+            if node.kind is _NodeKind.VALUE:
+                if position == len(segments):
+                    container[name] = value
+                return
+
+            if node.kind is _NodeKind.NESTED:
+                container = container.setdefault(name, {})
+                nodes = node.children
+                continue
+
+            if node.kind is _NodeKind.MULTIPLE:
+                self._insert_multiple(container, name, indexed, segments[position:], value, key)
+                return
+            if position == len(segments):
+                return
+            by_index = self._indexed(container, name, indexed)
+            segment = segments[position]
+            position += 1
+
+            container = by_index.setdefault(_parse_index(segment, key), {})
+            nodes = node.children
+
+    @classmethod
+    def _insert_multiple(
+        cls,
+        container: dict[str, Any],
+        name: str,
+        indexed: list[tuple[dict[str, Any], str]],
+        segments: list[str],
+        value: Any,
+        key: str,
+    ) -> None:
+        if not segments:
+            # The LMS already submitted the selected values as a list, or a single value under the bare key.
+            by_index = cls._indexed(container, name, indexed)
+            for item in value if isinstance(value, list) else [value]:
+                by_index[_appended(by_index)] = item
+        elif len(segments) == 1:
+            by_index = cls._indexed(container, name, indexed)
+            by_index[_appended(by_index) if segments[0] == "" else (0, _parse_index(segments[0], key))] = value
+
+    @staticmethod
+    def _indexed(container: dict[str, Any], name: str, indexed: list[tuple[dict[str, Any], str]]) -> dict[Any, Any]:
+        if name not in container:
+            container[name] = {}
+            indexed.append((container, name))
+        return container[name]
+
+    def iter_keys(self, repetitions: Mapping[str, int] | None = None) -> Iterator[str]:
+        """Lazily generates the flat keys of all inputs in the form, expanding repetitions on the fly.
+
+        Multiple-selects are yielded once without an index, as the number of their values is not known in advance. A
+        single value or a list of values submitted under that key is accepted by :meth:`unflatten`.
+
+        Args:
+            repetitions: Number of repetitions by flat key of the repetition (e.g. ``my_section[my_repetition]`` or
+                         ``my_repetition[0][inner_repetition]``). Defaults to the repetition's ``initial_repetitions``.
+        """
+        return self._iter_keys(self._root.children, "", repetitions or {})
+
+    def _iter_keys(self, nodes: dict[str, _Node], prefix: str, repetitions: Mapping[str, int]) -> Iterator[str]:
+        for name, node in nodes.items():
+            key = f"{prefix}[{name}]" if prefix else name
+            if node.kind is _NodeKind.VALUE or node.kind is _NodeKind.MULTIPLE:
+                yield key
+            elif node.kind is _NodeKind.NESTED:
+                yield from self._iter_keys(node.children, key, repetitions)
+            else:
+                for index in range(repetitions.get(key, node.initial_repetitions)):
+                    yield from self._iter_keys(node.children, f"{key}[{index}]", repetitions)
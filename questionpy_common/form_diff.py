@@ -0,0 +1,384 @@
+#  This file is part of QuestionPy. (https://questionpy.org)
+#  QuestionPy is free software released under terms of the MIT license. See LICENSE.md.
+#  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
+"""Structural diffs and patches of :class:`OptionsFormDefinition`.
+
+Elements are identified by paths of names. The first segment of a path is the field of the form definition the element
+lives in (``general`` or ``sections``), followed by the names of the containing sections, groups, repetitions or
+checkbox groups and finally the name of the element itself. For example, ``["sections", "advanced", "my_group",
+"my_input"]`` refers to the element ``my_input`` inside the group ``my_group`` of the section ``advanced``.
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator, Sequence
+from typing import Annotated, Any, Literal, TypeAlias
+
+from pydantic import BaseModel, Field, TypeAdapter
+
+from questionpy_common.elements import FormElement, FormSection, OptionsFormDefinition
+
+__all__ = [
+    "AddOperation",
+    "FormPatch",
+    "FormPatchError",
+    "FormPatchOperation",
+    "RemoveOperation",
+    "ReorderOperation",
+    "UpdateOperation",
+    "apply_form_patch",
+    "apply_form_patch_to_dict",
+    "diff_forms",
+]
+
+_ROOT_FIELDS = ("general", "sections")
+_CHILDREN_FIELDS = {"checkbox_group": "checkboxes", "group": "elements", "repetition": "elements"}
+
+_form_element_adapter: TypeAdapter[FormElement] = TypeAdapter(FormElement)
+
+
+class _BaseOperation(BaseModel):
+    op: str
+
+
+class AddOperation(_BaseOperation):
+    """Inserts a new element or section into a container."""
+
+    op: Literal["add"] = "add"
+    parent: list[str]
+    """Path of the container, e.g. ``["general"]`` or ``["sections", "advanced", "my_group"]``."""
+    index: int
+    """Position of the new element in the container after insertion."""
+    value: dict[str, Any]
+    """Serialized element or section."""
+
+
+class RemoveOperation(_BaseOperation):
+    """Removes an element or section including its children."""
+
+    op: Literal["remove"] = "remove"
+    path: list[str]
+
+
+class UpdateOperation(_BaseOperation):
+    """Changes some fields of an element or section, leaving its children untouched."""
+
+    op: Literal["update"] = "update"
+    path: list[str]
+    fields: dict[str, Any]
+    """Serialized new values of the changed fields."""
+
+
+class ReorderOperation(_BaseOperation):
+    """Changes the order of the children of a container."""
+
+    op: Literal["reorder"] = "reorder"
+    parent: list[str]
+    names: list[str]
+    """Names of all children of the container in their new order."""
+
+
+FormPatchOperation: TypeAlias = Annotated[
+    AddOperation | RemoveOperation | ReorderOperation | UpdateOperation, Field(discriminator="op")
+]
+
+
+class FormPatch(BaseModel):
+    """Changes turning one :class:`OptionsFormDefinition` into another, as returned by :func:`diff_forms`."""
+
+    operations: list[FormPatchOperation] = []
+    """Operations to be applied in order."""
+
+
+class FormPatchError(Exception):
+    pass
+
+
+def _children_field(node: BaseModel) -> str | None:
+    if isinstance(node, FormSection):
+        return "elements"
+    return _CHILDREN_FIELDS.get(getattr(node, "kind", ""))
+
+
+def _index_by_name(children: Sequence[BaseModel], path: list[str]) -> dict[str, BaseModel]:
+    by_name = {child.name: child for child in children}  # type: ignore[attr-defined]
+    if len(by_name) != len(children):
+        msg = f"Names of the children of '{'/'.join(path)}' are not unique."
+        raise FormPatchError(msg)
+    return by_name
+
+
+def _diff_children(
+    old: Sequence[BaseModel], new: Sequence[BaseModel], parent: list[str]
+) -> Iterator[FormPatchOperation]:
+    old_by_name = _index_by_name(old, parent)
+    new_by_name = _index_by_name(new, parent)
+
+    replaced = set()
+    for name, old_child in old_by_name.items():
+        new_child = new_by_name.get(name)
+        if new_child is None:
+            yield RemoveOperation(path=[*parent, name])
+        elif type(old_child) is not type(new_child):
+            # A change of the element kind is treated as a removal and re-insertion.
+            replaced.add(name)
+            yield RemoveOperation(path=[*parent, name])
+
+    kept_old_order = [name for name in old_by_name if name in new_by_name and name not in replaced]
+    kept_new_order = [name for name in new_by_name if name in old_by_name and name not in replaced]
+    if kept_old_order != kept_new_order:
+        yield ReorderOperation(parent=parent, names=kept_new_order)
+
+    for index, new_child in enumerate(new):
+        name = new_child.name  # type: ignore[attr-defined]
+        if name not in old_by_name or name in replaced:
+            yield AddOperation(parent=parent, index=index, value=new_child.model_dump(mode="json"))
+
+    for name in kept_new_order:
+        yield from _diff_node(old_by_name[name], new_by_name[name], [*parent, name])
+
+
+def _diff_node(old: BaseModel, new: BaseModel, path: list[str]) -> Iterator[FormPatchOperation]:
+    if old == new:
+        return
+
+    children_field = _children_field(old)
+    changed = {
+        field
+        for field in type(old).model_fields
+        if field != children_field and getattr(old, field) != getattr(new, field)
+    }
+    if changed:
+        yield UpdateOperation(path=path, fields=new.model_dump(mode="json", include=changed))
+    if children_field:
+        yield from _diff_children(getattr(old, children_field), getattr(new, children_field), path)
+
+
+def diff_forms(old: OptionsFormDefinition, new: OptionsFormDefinition) -> FormPatch:
+    """Computes the changes between two form definitions.
+
+    Unchanged subtrees are skipped entirely, so the resulting patch only contains operations for the elements which
+    were actually added, removed, moved or modified.
+
+    Raises:
+        FormPatchError: If the names of the children of any container are not unique.
+    """
+    operations = [
+        operation
+        for field in _ROOT_FIELDS
+        for operation in _diff_children(getattr(old, field), getattr(new, field), [field])
+    ]
+    return FormPatch(operations=operations)
+
+
+class _Patcher(ABC):
+    """Applies patches copy-on-write, so that all subtrees not touched by an operation are shared with the input."""
+
+    def apply(self, root: Any, patch: FormPatch) -> Any:
+        for operation in patch.operations:
+            parent: list[str]
+            modify: Callable[[list[Any]], list[Any]]
+            if isinstance(operation, AddOperation):
+                parent, modify = operation.parent, self._adder(operation)
+            elif isinstance(operation, RemoveOperation):
+                parent, modify = operation.path[:-1], self._remover(operation)
+            elif isinstance(operation, ReorderOperation):
+                parent, modify = operation.parent, self._reorderer(operation)
+            else:
+                parent, modify = operation.path[:-1], self._updater(operation)
+            root = self._modify_container(root, parent, modify)
+        return root
+
+    # Methods to be implemented for the respective node representation.
+
+    @abstractmethod
+    def get_children(self, node: Any, field: str) -> list[Any]: ...
+
+    @abstractmethod
+    def with_children(self, node: Any, field: str, children: list[Any]) -> Any: ...
+
+    @abstractmethod
+    def get_name(self, node: Any) -> str: ...
+
+    @abstractmethod
+    def children_field(self, node: Any) -> str | None: ...
+
+    @abstractmethod
+    def create(self, value: dict[str, Any], *, section: bool) -> Any: ...
+
+    @abstractmethod
+    def update(self, node: Any, fields: dict[str, Any]) -> Any: ...
+
+    # Generic implementation.
+
+    @staticmethod
+    def _split(path: list[str]) -> str:
+        if len(path) <= 1:
+            msg = f"Invalid path '{'/'.join(path)}'."
+            raise FormPatchError(msg)
+        return path[-1]
+
+    def _modify_container(self, root: Any, parent: list[str], modify: Callable[[list[Any]], list[Any]]) -> Any:
+        if not parent or parent[0] not in _ROOT_FIELDS:
+            msg = f"Invalid path '{'/'.join(parent)}'."
+            raise FormPatchError(msg)
+        field = parent[0]
+        children = self._modify_children(self.get_children(root, field), parent[1:], modify, parent)
+        return self.with_children(root, field, children)
+
+    def _modify_children(
+        self, children: list[Any], names: list[str], modify: Callable[[list[Any]], list[Any]], parent: list[str]
+    ) -> list[Any]:
+        if not names:
+            return modify(children)
+
+        index = self._find(children, names[0], parent)
+        child = children[index]
+        field = self.children_field(child)
+        if field is None:
+            msg = f"'{'/'.join(parent)}' is not a container."
+            raise FormPatchError(msg)
+        new_child = self.with_children(
+            child, field, self._modify_children(self.get_children(child, field), names[1:], modify, parent)
+        )
+        return [*children[:index], new_child, *children[index + 1 :]]
+
+    def _find(self, children: list[Any], name: str, path: list[str]) -> int:
+        for index, child in enumerate(children):
+            if self.get_name(child) == name:
+                return index
+        msg = f"'{name}' does not exist in '{'/'.join(path)}'."
+        raise FormPatchError(msg)
+
+    def _remover(self, operation: RemoveOperation) -> Callable[[list[Any]], list[Any]]:
+        name = self._split(operation.path)
+
+        def remove(children: list[Any]) -> list[Any]:
+            index = self._find(children, name, operation.path[:-1])
+            return [*children[:index], *children[index + 1 :]]
+
+        return remove
+
+    def _adder(self, operation: AddOperation) -> Callable[[list[Any]], list[Any]]:
+        def add(children: list[Any]) -> list[Any]:
+            if not 0 <= operation.index <= len(children):
+                msg = f"Index {operation.index} is out of range for '{'/'.join(operation.parent)}'."
+                raise FormPatchError(msg)
+            new = self.create(operation.value, section=operation.parent == ["sections"])
+            return [*children[: operation.index], new, *children[operation.index :]]
+
+        return add
+
+    def _reorderer(self, operation: ReorderOperation) -> Callable[[list[Any]], list[Any]]:
+        def reorder(children: list[Any]) -> list[Any]:
+            by_name = {self.get_name(child): child for child in children}
+            if sorted(by_name) != sorted(operation.names) or len(by_name) != len(children):
+                msg = f"Names to reorder do not match the children of '{'/'.join(operation.parent)}'."
+                raise FormPatchError(msg)
+            return [by_name[name] for name in operation.names]
+
+        return reorder
+
+    def _updater(self, operation: UpdateOperation) -> Callable[[list[Any]], list[Any]]:
+        name = self._split(operation.path)
+
+        def update(children: list[Any]) -> list[Any]:
+            index = self._find(children, name, operation.path[:-1])
+            return [*children[:index], self.update(children[index], operation.fields), *children[index + 1 :]]
+
+        return update
+
+
+class _ModelPatcher(_Patcher):
+    def get_children(self, node: BaseModel, field: str) -> list[Any]:
+        return getattr(node, field)
+
+    def with_children(self, node: BaseModel, field: str, children: list[Any]) -> BaseModel:
+        return node.model_copy(update={field: children})
+
+    def get_name(self, node: BaseModel) -> str:
+        return node.name  # type: ignore[attr-defined]
+
+    def children_field(self, node: BaseModel) -> str | None:
+        return _children_field(node)
+
+    def create(self, value: dict[str, Any], *, section: bool) -> BaseModel:
+        if section:
+            return FormSection.model_validate(value)
+        return _form_element_adapter.validate_python(value)
+
+    def update(self, node: BaseModel, fields: dict[str, Any]) -> BaseModel:
+        field = _children_field(node)
+        if field and field in fields:
+            msg = f"Children of '{self.get_name(node)}' can not be updated, use add, remove and reorder instead."
+            raise FormPatchError(msg)
+
+        # Only the node itself is validated, its (unchanged) children are put back afterwards.
+        data = {name: getattr(node, name) for name in node.model_fields_set}
+        data.update(fields)
+        if field:
+            data[field] = []
+        updated = type(node).model_validate(data)
+        return updated.model_copy(update={field: getattr(node, field)}) if field else updated
+
+
+class _DictPatcher(_Patcher):
+    def __init__(self) -> None:
+        self._models = _ModelPatcher()
+
+    def get_children(self, node: dict[str, Any], field: str) -> list[Any]:
+        return node.get(field, [])
+
+    def with_children(self, node: dict[str, Any], field: str, children: list[Any]) -> dict[str, Any]:
+        return {**node, field: children}
+
+    def get_name(self, node: dict[str, Any]) -> str:
+        return node["name"]
+
+    def children_field(self, node: dict[str, Any]) -> str | None:
+        if "kind" not in node:
+            return "elements"
+        return _CHILDREN_FIELDS.get(node["kind"])
+
+    def create(self, value: dict[str, Any], *, section: bool) -> dict[str, Any]:
+        return self._models.create(value, section=section).model_dump(mode="json")
+
+    def update(self, node: dict[str, Any], fields: dict[str, Any]) -> dict[str, Any]:
+        field = self.children_field(node)
+        if field and field in fields:
+            msg = f"Children of '{node['name']}' can not be updated, use add, remove and reorder instead."
+            raise FormPatchError(msg)
+
+        # Only the node itself is validated, its (unchanged) children are put back afterwards.
+        data = {**node, **fields}
+        if field:
+            data[field] = []
+        model = FormSection.model_validate(data) if "kind" not in node else _form_element_adapter.validate_python(data)
+        updated = model.model_dump(mode="json")
+        if field:
+            updated[field] = node.get(field, [])
+        return updated
+
+
+def apply_form_patch(form: OptionsFormDefinition, patch: FormPatch) -> OptionsFormDefinition:
+    """Applies a patch to a form definition.
+
+    The given form is not modified. Subtrees which are not touched by the patch are shared between the given and the
+    returned form definition and are not re-validated.
+
+    Raises:
+        FormPatchError: If the patch does not fit the form.
+        pydantic.ValidationError: If an added or updated element is invalid.
+    """
+    return _ModelPatcher().apply(form, patch)
+
+
+def apply_form_patch_to_dict(data: dict[str, Any], patch: FormPatch) -> dict[str, Any]:
+    """Applies a patch to a serialized form definition, as returned by ``form.model_dump(mode="json")``.
+
+    Like :func:`apply_form_patch`, but for cached serialized forms. Only added and updated elements are validated.
+
+    Raises:
+        FormPatchError: If the patch does not fit the form.
+        pydantic.ValidationError: If an added or updated element is invalid.
+    """
+    return _DictPatcher().apply(data, patch)
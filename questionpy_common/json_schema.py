@@ -0,0 +1,135 @@
+#  This file is part of QuestionPy. (https://questionpy.org)
+#  QuestionPy is free software released under terms of the MIT license. See LICENSE.md.
+#  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
+"""Precomputed JSON Schemas of the public models.
+
+Generating the JSON Schema of models containing the recursive :data:`FormElement` union is slow, so the schemas are
+generated at build time and shipped as part of the package. Regenerate them after changing any of the models using::
+
+    python -m questionpy_common.json_schema
+"""
+
+import json
+from collections.abc import Mapping
+from functools import cache
+from importlib.resources import files
+from importlib.resources.abc import Traversable
+from pathlib import Path
+from typing import Any, Final
+
+from pydantic import BaseModel
+
+from questionpy_common.api.attempt import AttemptModel, AttemptScoredModel, ScoreModel
+from questionpy_common.api.question import QuestionModel
+from questionpy_common.elements import OptionsFormDefinition
+from questionpy_common.manifest import Manifest
+
+__all__ = [
+    "JSON_SCHEMA_MODELS",
+    "JSON_SCHEMA_VERSION",
+    "UnknownJsonSchemaError",
+    "check_json_schemas",
+    "get_json_schema",
+    "write_json_schemas",
+]
+
+JSON_SCHEMA_VERSION: Final[int] = 1
+"""Version of the shipped schemas. Incremented whenever any of them changes."""
+
+JSON_SCHEMA_MODELS: Final[Mapping[str, type[BaseModel]]] = {
+    model.__name__: model
+    for model in (
+        AttemptModel,
+        AttemptScoredModel,
+        Manifest,
+        OptionsFormDefinition,
+        QuestionModel,
+        ScoreModel,
+    )
+}
+"""Models for which a JSON Schema is shipped, by name."""
+
+_INDEX_FILENAME = "index.json"
+
+
+class UnknownJsonSchemaError(KeyError):
+    pass
+
+
+def _shipped_schemas() -> Traversable:
+    # Read through importlib.resources, so that the schemas can also be loaded when the package is installed as a zip.
+    return files(__package__ or "questionpy_common").joinpath("json_schemas")
+
+
+@cache
+def _load_index() -> dict[str, Any]:
+    index = json.loads(_shipped_schemas().joinpath(_INDEX_FILENAME).read_text())
+    if index["version"] != JSON_SCHEMA_VERSION:
+        msg = f"Shipped JSON Schemas have version {index['version']}, expected {JSON_SCHEMA_VERSION}."
+        raise RuntimeError(msg)
+    return index
+
+
+@cache
+def _load_schema(name: str) -> dict[str, Any]:
+    if name not in _load_index()["schemas"]:
+        raise UnknownJsonSchemaError(name)
+    return json.loads(_shipped_schemas().joinpath(f"{name}.json").read_text())
+
+
+def get_json_schema(model: type[BaseModel] | str) -> dict[str, Any]:
+    """Gets the precomputed JSON Schema of the given model.
+
+    The schema is loaded on first access and cached afterwards. It is equal to the result of
+    ``model.model_json_schema()``, but the returned dictionary is shared and must not be modified.
+
+    Args:
+        model: One of the models in :data:`JSON_SCHEMA_MODELS` or its name.
+
+    Raises:
+        UnknownJsonSchemaError: If no schema is shipped for the given model.
+    """
+    name = model if isinstance(model, str) else model.__name__
+    if not isinstance(model, str) and JSON_SCHEMA_MODELS.get(name) is not model:
+        raise UnknownJsonSchemaError(name)
+    return _load_schema(name)
+
+
+def check_json_schemas() -> list[str]:
+    """Compares the shipped JSON Schemas to the ones generated from the current models.
+
+    Returns:
+        Names of the models whose shipped schema is missing or outdated. Empty if all schemas are consistent.
+    """
+    outdated = []
+    for name, model in JSON_SCHEMA_MODELS.items():
+        try:
+            shipped = _load_schema(name)
+        except (UnknownJsonSchemaError, FileNotFoundError):
+            outdated.append(name)
+            continue
+        if shipped != model.model_json_schema():
+            outdated.append(name)
+    return outdated
+
+
+def write_json_schemas(directory: Path | None = None) -> None:
+    """Generates the JSON Schemas of all models in :data:`JSON_SCHEMA_MODELS` and writes them to `directory`.
+
+    Args:
+        directory: Target directory. Defaults to the directory the schemas are shipped in, which requires the package
+                   to be installed as plain files, e.g. as a source checkout.
+    """
+    directory = directory or Path(str(_shipped_schemas()))
+    directory.mkdir(parents=True, exist_ok=True)
+    for name, model in JSON_SCHEMA_MODELS.items():
+        (directory / f"{name}.json").write_text(json.dumps(model.model_json_schema(), indent=2) + "\n")
+    index = {"version": JSON_SCHEMA_VERSION, "schemas": sorted(JSON_SCHEMA_MODELS)}
+    (directory / _INDEX_FILENAME).write_text(json.dumps(index, indent=2) + "\n")
+
+    _load_index.cache_clear()
+    _load_schema.cache_clear()
+
+
+if __name__ == "__main__":
+    write_json_schemas()
@@ -0,0 +1,160 @@
+#  This file is part of QuestionPy. (https://questionpy.org)
+#  QuestionPy is free software released under terms of the MIT license. See LICENSE.md.
+#  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
+"""Negotiation of the language of localized manifest fields.
+
+Fallback chains are computed once per distinct tuple of preferred languages and the localized views of a package index
+are cached per fallback chain, so rendering a catalog for many users only negotiates once per language preference.
+"""
+
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from threading import Lock
+from typing import Final
+
+from questionpy_common.environment import RequestUser
+from questionpy_common.manifest import Manifest
+
+__all__ = [
+    "DEFAULT_LANGUAGE",
+    "LocalizedManifest",
+    "LocalizedPackageIndex",
+    "fallback_chain",
+    "negotiate_language",
+    "normalize_language",
+]
+
+DEFAULT_LANGUAGE: Final[str] = "en"
+"""Language used when none of the preferred languages is available."""
+
+
+def normalize_language(tag: str) -> str:
+    """Normalizes a language tag, e.g. ``de_CH`` to ``de-ch``."""
+    return tag.strip().replace("_", "-").lower()
+
+
+@lru_cache(maxsize=1024)
+def fallback_chain(preferred_languages: tuple[str, ...]) -> tuple[str, ...]:
+    """Computes the order in which languages are tried for the given preferences.
+
+    Each preferred language is directly followed by its more general forms, so ``("de-CH", "fr")`` results in
+    ``("de-ch", "de", "fr", "en")``. :data:`DEFAULT_LANGUAGE` is appended unless the preferences already include it, in
+    which case their ranking is kept.
+    """
+    chain: dict[str, None] = {}
+    for tag in preferred_languages:
+        subtags = normalize_language(tag).split("-")
+        for length in range(len(subtags), 0, -1):
+            chain.setdefault("-".join(subtags[:length]))
+    chain.pop("", None)
+    chain.setdefault(DEFAULT_LANGUAGE)
+    return tuple(chain)
+
+
+def negotiate_language(preferred_languages: Sequence[str], available: Iterable[str]) -> str | None:
+    """Chooses the best of the available languages for the given preferences.
+
+    Returns:
+        The chosen language as given in `available`, or ``None`` if nothing is available. If no language in the
+        fallback chain is available, the alphabetically first available language is chosen.
+    """
+    by_normalized = {normalize_language(language): language for language in available}
+    for language in fallback_chain(tuple(preferred_languages)):
+        if language in by_normalized:
+            return by_normalized[language]
+    return by_normalized[min(by_normalized)] if by_normalized else None
+
+
+@dataclass(frozen=True)
+class LocalizedManifest:
+    """A manifest with its localized fields resolved for a specific language preference."""
+
+    manifest: Manifest
+    language: str | None
+    """Negotiated language of the package, out of :attr:`Manifest.languages`."""
+    name: str
+    """Localized name, or the short name if the manifest does not have a name."""
+    description: str | None
+
+
+class _PreparedManifest:
+    """Manifest whose localized fields are indexed by normalized language."""
+
+    __slots__ = ("description", "languages", "manifest", "name")
+
+    def __init__(self, manifest: Manifest):
+        self.manifest = manifest
+        self.languages = {normalize_language(language): language for language in manifest.languages}
+        self.name = {normalize_language(language): text for language, text in manifest.name.items()}
+        self.description = {normalize_language(language): text for language, text in manifest.description.items()}
+
+    @staticmethod
+    def _resolve(values: Mapping[str, str], chain: tuple[str, ...]) -> str | None:
+        for language in chain:
+            if language in values:
+                return values[language]
+        return values[min(values)] if values else None
+
+    def localize(self, chain: tuple[str, ...]) -> LocalizedManifest:
+        return LocalizedManifest(
+            manifest=self.manifest,
+            language=self._resolve(self.languages, chain),
+            name=self._resolve(self.name, chain) or self.manifest.short_name,
+            description=self._resolve(self.description, chain),
+        )
+
+
+class LocalizedPackageIndex:
+    """Index of manifests which caches the localized views of all packages per fallback chain.
+
+    Users with different language preferences which result in the same fallback chain share the cached views. The
+    index is immutable, create a new one when the set of packages changes.
+    """
+
+    def __init__(self, manifests: Iterable[Manifest], *, max_cached_chains: int = 256):
+        """Prepares the given manifests for localization.
+
+        Args:
+            manifests: Manifests of the packages in the index.
+            max_cached_chains: Number of fallback chains whose localized views are kept.
+        """
+        self._prepared = {manifest.identifier: _PreparedManifest(manifest) for manifest in manifests}
+        self._max_cached_chains = max_cached_chains
+        self._cache: OrderedDict[tuple[str, ...], dict[str, LocalizedManifest]] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._prepared)
+
+    def localize(self, preferred_languages: Sequence[str] | RequestUser) -> Mapping[str, LocalizedManifest]:
+        """Gets the localized views of all packages, by package identifier.
+
+        Args:
+            preferred_languages: Preferred languages in descending order, or the user whose preferences to use.
+        """
+        if isinstance(preferred_languages, RequestUser):
+            preferred_languages = preferred_languages.preferred_languages
+        chain = fallback_chain(tuple(preferred_languages))
+
+        with self._lock:
+            views = self._cache.get(chain)
+            if views is not None:
+                self._cache.move_to_end(chain)
+                return views
+
+        views = {identifier: prepared.localize(chain) for identifier, prepared in self._prepared.items()}
+        with self._lock:
+            self._cache[chain] = views
+            if len(self._cache) > self._max_cached_chains:
+                self._cache.popitem(last=False)
+        return views
+
+    def get(self, identifier: str, preferred_languages: Sequence[str] | RequestUser) -> LocalizedManifest:
+        """Gets the localized view of a single package.
+
+        Raises:
+            KeyError: If the package is not in the index.
+        """
+        return self.localize(preferred_languages)[identifier]
@@ -0,0 +1,102 @@
+#  This file is part of QuestionPy. (https://questionpy.org)
+#  QuestionPy is free software released under terms of the MIT license. See LICENSE.md.
+#  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
+"""Streaming export and import of models as newline-delimited JSON (NDJSON).
+
+Each model is written as one line of JSON, so arbitrarily many records, e.g. :class:`AttemptScoredModel`s for a
+gradebook sync, can be written and read with constant memory. Streams can optionally be gzip-compressed.
+"""
+
+import gzip
+from collections.abc import Iterable, Iterator
+from contextlib import ExitStack
+from functools import cache
+from itertools import islice
+from typing import IO, TypeVar
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+__all__ = ["NdjsonError", "read_ndjson", "write_ndjson"]
+
+_M = TypeVar("_M", bound=BaseModel)
+
+
+class NdjsonError(ValueError):
+    """A line of an NDJSON stream does not contain a valid record."""
+
+    def __init__(self, line: int, error: ValidationError):
+        self.line = line
+        self.error = error
+        super().__init__(f"Invalid record on line {line}: {error}")
+
+
+def _validate_lines(model: type[_M], chunk: list[tuple[int, bytes]]) -> list[_M]:
+    records = []
+    for number, line in chunk:
+        try:
+            records.append(model.model_validate_json(line))
+        except ValidationError as error:
+            raise NdjsonError(number, error) from None
+    return records
+
+
+@cache
+def _list_adapter(model: type[_M]) -> TypeAdapter[list[_M]]:
+    return TypeAdapter(list[model])  # type: ignore[valid-type]
+
+
+def write_ndjson(stream: IO[bytes], models: Iterable[BaseModel], *, compress: bool = False) -> int:
+    """Writes models to a binary stream, one JSON object per line.
+
+    Args:
+        stream: Binary stream to write to. It is not closed.
+        models: Models to write. Only one model is kept in memory at a time.
+        compress: Whether to gzip-compress the output.
+
+    Returns:
+        The number of written records.
+    """
+    count = 0
+    with ExitStack() as stack:
+        target: IO[bytes] | gzip.GzipFile = (
+            stack.enter_context(gzip.GzipFile(fileobj=stream, mode="wb")) if compress else stream
+        )
+        for model in models:
+            target.write(model.model_dump_json().encode() + b"\n")
+            count += 1
+    return count
+
+
+def read_ndjson(
+    stream: IO[bytes], model: type[_M], *, compressed: bool = False, chunk_size: int = 1000
+) -> Iterator[_M]:
+    """Lazily reads models from a binary stream written by :func:`write_ndjson`.
+
+    Lines are validated in chunks of `chunk_size` with a single call to pydantic, which is considerably faster than
+    validating each line on its own. Empty lines are skipped.
+
+    Args:
+        stream: Binary stream to read from. It is not closed.
+        model: Type of the records.
+        compressed: Whether the stream is gzip-compressed.
+        chunk_size: Number of lines to validate at once. Also the maximum number of records kept in memory.
+
+    Raises:
+        NdjsonError: If a line does not contain a valid record. Records before the invalid chunk have been yielded.
+    """
+    adapter = _list_adapter(model)
+    with ExitStack() as stack:
+        source: IO[bytes] | gzip.GzipFile = (
+            stack.enter_context(gzip.GzipFile(fileobj=stream, mode="rb")) if compressed else stream
+        )
+        numbered = ((number, line) for number, line in enumerate(source, 1) if line.strip())
+        while chunk := list(islice(numbered, chunk_size)):
+            try:
+                records = adapter.validate_json(b"[" + b",".join(line for _, line in chunk) + b"]")
+            except ValidationError:
+                records = []
+            if len(records) != len(chunk):
+                # Either a record is invalid, or a line contains more than one record (e.g. "{...},{...}"), which the
+                # joined array hides. Validating each line on its own finds the offending line.
+                records = _validate_lines(model, chunk)
+            yield from records
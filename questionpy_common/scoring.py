@@ -0,0 +1,130 @@
+#  This file is part of QuestionPy. (https://questionpy.org)
+#  QuestionPy is free software released under terms of the MIT license. See LICENSE.md.
+#  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
+"""Computation of final scores from the scores of the individual tries of attempts.
+
+The score of the try with index ``i`` (starting at 0) is reduced by ``i * penalty``. With
+:attr:`ScoringMethod.AUTOMATICALLY_SCORABLE_WITH_COUNTBACK`, the best of these penalized scores counts, otherwise the
+one of the last try. The result is clamped to ``[score_min, score_max]`` and can optionally be corrected for guessing
+using the question's ``random_guess_score``.
+
+:func:`score_attempt` is the scalar reference implementation. :func:`score_attempts` computes the same results for many
+attempts at once, hoisting everything which only depends on the question out of the per-attempt work.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from operator import sub
+
+from questionpy_common.api.question import QuestionModel, ScoringMethod
+
+__all__ = ["ScoringParameters", "score_attempt", "score_attempts"]
+
+
+@dataclass(frozen=True)
+class ScoringParameters:
+    """The parts of a :class:`QuestionModel` relevant for computing final scores."""
+
+    countback: bool = False
+    penalty: float = 0
+    score_min: float = 0
+    score_max: float = 1
+    random_guess_score: float | None = None
+
+    @classmethod
+    def from_question(cls, question: QuestionModel) -> "ScoringParameters":
+        """Extracts the scoring parameters of a question.
+
+        Raises:
+            ValueError: If the question always requires manual scoring.
+        """
+        if question.scoring_method is ScoringMethod.ALWAYS_MANUAL_SCORING_REQUIRED:
+            msg = "Questions which always require manual scoring can not be scored automatically."
+            raise ValueError(msg)
+        return cls(
+            countback=question.scoring_method is ScoringMethod.AUTOMATICALLY_SCORABLE_WITH_COUNTBACK,
+            penalty=question.penalty or 0,
+            score_min=question.score_min,
+            score_max=question.score_max,
+            random_guess_score=question.random_guess_score,
+        )
+
+
+def _parameters(question: QuestionModel | ScoringParameters) -> ScoringParameters:
+    return question if isinstance(question, ScoringParameters) else ScoringParameters.from_question(question)
+
+
+def _guess_adjusted(score: float, guess: float, score_max: float) -> float:
+    return score_max * (score - guess) / (score_max - guess)
+
+
+def score_attempt(
+    question: QuestionModel | ScoringParameters, tries: Sequence[float], *, adjust_for_guessing: bool = False
+) -> float | None:
+    """Computes the final score of a single attempt.
+
+    Args:
+        question: The question or its scoring parameters.
+        tries: Raw scores of the tries in chronological order.
+        adjust_for_guessing: Whether to rescale the score so that the ``random_guess_score`` results in 0. Ignored if
+                             the question has no ``random_guess_score`` or it is not below ``score_max``.
+
+    Returns:
+        The final score, or ``None`` if there are no tries.
+
+    Raises:
+        ValueError: If the question always requires manual scoring.
+    """
+    parameters = _parameters(question)
+    if not tries:
+        return None
+
+    penalized = [raw - index * parameters.penalty for index, raw in enumerate(tries)]
+    score = max(penalized) if parameters.countback else penalized[-1]
+    score = min(max(score, parameters.score_min), parameters.score_max)
+
+    guess = parameters.random_guess_score
+    if adjust_for_guessing and guess is not None and guess < parameters.score_max:
+        score = _guess_adjusted(score, guess, parameters.score_max)
+        score = min(max(score, parameters.score_min), parameters.score_max)
+    return score
+
+
+def score_attempts(
+    question: QuestionModel | ScoringParameters,
+    attempts: Sequence[Sequence[float]],
+    *,
+    adjust_for_guessing: bool = False,
+) -> list[float | None]:
+    """Computes the final scores of many attempts at the same question.
+
+    The results are identical to calling :func:`score_attempt` for each attempt.
+
+    Args:
+        question: The question or its scoring parameters.
+        attempts: For each attempt, the raw scores of its tries in chronological order.
+        adjust_for_guessing: See :func:`score_attempt`.
+
+    Raises:
+        ValueError: If the question always requires manual scoring.
+    """
+    parameters = _parameters(question)
+    score_min, score_max = parameters.score_min, parameters.score_max
+    max_tries = max(map(len, attempts), default=0)
+    # offsets[i] == i * penalty, computed once for all attempts.
+    offsets = [index * parameters.penalty for index in range(max_tries)]
+
+    if parameters.countback:
+        raw_scores = [max(map(sub, tries, offsets)) if tries else None for tries in attempts]
+    else:
+        raw_scores = [tries[-1] - offsets[len(tries) - 1] if tries else None for tries in attempts]
+
+    scores = [None if score is None else min(max(score, score_min), score_max) for score in raw_scores]
+
+    guess = parameters.random_guess_score
+    if adjust_for_guessing and guess is not None and guess < score_max:
+        scores = [
+            None if score is None else min(max(_guess_adjusted(score, guess, score_max), score_min), score_max)
+            for score in scores
+        ]
+    return scores
@@ -0,0 +1,206 @@
+#  This file is part of QuestionPy. (https://questionpy.org)
+#  QuestionPy is free software released under terms of the MIT license. See LICENSE.md.
+#  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
+"""Inverted full-text index over package manifests."""
+
+import heapq
+import math
+import re
+import unicodedata
+from bisect import bisect_left, insort
+from collections.abc import Collection, Iterable, Iterator
+from dataclasses import dataclass
+from itertools import starmap
+from threading import RLock
+from typing import Final
+
+from questionpy_common.languages import normalize_language
+from questionpy_common.manifest import Manifest
+
+__all__ = ["FIELD_WEIGHTS", "ManifestSearchIndex", "SearchHit", "tokenize"]
+
+FIELD_WEIGHTS: Final = {"short_name": 3.0, "name": 3.0, "tags": 2.0, "author": 1.0, "description": 1.0}
+"""Weight of a match in each of the indexed manifest fields."""
+
+_PREFIX_MATCH_FACTOR = 0.5
+_TF_SATURATION = 1.2
+_TOKEN = re.compile(r"[^\W_]+")
+_STOPWORDS: Final[dict[str, frozenset[str]]] = {
+    "de": frozenset({"der", "die", "das", "ein", "eine", "und", "oder", "mit", "fur", "von", "zu", "im", "in", "ist"}),
+    "en": frozenset({"a", "an", "the", "and", "or", "of", "for", "with", "to", "in", "is", "on"}),
+}
+
+
+def _fold(text: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(char for char in decomposed if not unicodedata.combining(char)).casefold()
+
+
+def tokenize(text: str, language: str | None = None) -> list[str]:
+    """Splits text into normalized tokens.
+
+    Tokens are case- and accent-folded and split at anything that is not a letter or digit, including underscores.
+    Stopwords of the given language are left out.
+    """
+    stopwords = _STOPWORDS.get(normalize_language(language).split("-")[0], frozenset()) if language else frozenset()
+    return [token for token in _TOKEN.findall(_fold(text)) if token not in stopwords]
+
+
+def _with_general_languages(languages: Iterable[str]) -> set[str]:
+    # Regional variants also search the general language, e.g. de-ch also searches de.
+    normalized = {normalize_language(language) for language in languages}
+    return normalized | {language.split("-")[0] for language in normalized}
+
+
+@dataclass(frozen=True, slots=True)
+class SearchHit:
+    identifier: str
+    """Identifier of the matching package."""
+    score: float
+
+
+# For each document, the weighted term frequency by language. None is used for fields which are not localized.
+_Postings = dict[str, dict[str | None, float]]
+
+
+class ManifestSearchIndex:
+    """Ranked full-text search over manifests which can be updated incrementally.
+
+    The short name, author, tags and the localized names and descriptions are indexed. Localized fields are tokenized
+    according to their language, so searches can be restricted to the languages a user understands. A query matches a
+    package if every query token matches a token of the package, either exactly or, with a lower score, as a prefix.
+    """
+
+    def __init__(self, manifests: Iterable[Manifest] = ()):
+        self._postings: dict[str, _Postings] = {}
+        self._vocabulary: list[str] = []
+        self._document_tokens: dict[str, set[str]] = {}
+        self._lock = RLock()
+        for manifest in manifests:
+            self.add(manifest)
+
+    def __len__(self) -> int:
+        return len(self._document_tokens)
+
+    def __contains__(self, identifier: object) -> bool:
+        return identifier in self._document_tokens
+
+    @staticmethod
+    def _terms(manifest: Manifest) -> Iterator[tuple[str, str | None, float]]:
+        for token in tokenize(manifest.short_name):
+            yield token, None, FIELD_WEIGHTS["short_name"]
+        for token in tokenize(manifest.author):
+            yield token, None, FIELD_WEIGHTS["author"]
+        for tag in manifest.tags:
+            for token in tokenize(tag):
+                yield token, None, FIELD_WEIGHTS["tags"]
+        for field in ("name", "description"):
+            for language, text in getattr(manifest, field).items():
+                normalized = normalize_language(language)
+                for token in tokenize(text, normalized):
+                    yield token, normalized, FIELD_WEIGHTS[field]
+
+    def add(self, manifest: Manifest) -> None:
+        """Adds a manifest to the index, replacing an existing one with the same identifier."""
+        identifier = manifest.identifier
+        terms: dict[str, dict[str | None, float]] = {}
+        for token, language, weight in self._terms(manifest):
+            by_language = terms.setdefault(token, {})
+            by_language[language] = by_language.get(language, 0) + weight
+
+        with self._lock:
+            self.remove(identifier)
+            for token, by_language in terms.items():
+                postings = self._postings.get(token)
+                if postings is None:
+                    postings = self._postings[token] = {}
+                    insort(self._vocabulary, token)
+                postings[identifier] = by_language
+            self._document_tokens[identifier] = set(terms)
+
+    def remove(self, identifier: str) -> None:
+        """Removes a package from the index. Does nothing if it is not in the index."""
+        with self._lock:
+            for token in self._document_tokens.pop(identifier, ()):
+                postings = self._postings[token]
+                del postings[identifier]
+                if not postings:
+                    del self._postings[token]
+                    del self._vocabulary[bisect_left(self._vocabulary, token)]
+
+    def _expand(self, token: str, *, prefix: bool) -> Iterator[tuple[str, float]]:
+        if token in self._postings:
+            yield token, 1.0
+        if not prefix:
+            return
+        for position in range(bisect_left(self._vocabulary, token), len(self._vocabulary)):
+            candidate = self._vocabulary[position]
+            if not candidate.startswith(token):
+                break
+            if candidate != token:
+                yield candidate, _PREFIX_MATCH_FACTOR
+
+    def _score_token(self, token: str, languages: Collection[str] | None, *, prefix: bool) -> dict[str, float]:
+        scores: dict[str, float] = {}
+        for candidate, factor in self._expand(token, prefix=prefix):
+            postings = self._postings[candidate]
+            idf = math.log(1 + len(self._document_tokens) / len(postings))
+            for identifier, by_language in postings.items():
+                frequency = sum(
+                    weight
+                    for language, weight in by_language.items()
+                    if language is None
+                    or languages is None
+                    or language in languages
+                    or language.split("-")[0] in languages
+                )
+                if frequency:
+                    score = factor * idf * frequency / (frequency + _TF_SATURATION)
+                    scores[identifier] = max(scores.get(identifier, 0), score)
+        return scores
+
+    def search(
+        self, query: str, *, languages: Iterable[str] | None = None, limit: int | None = 20, prefix: bool = True
+    ) -> list[SearchHit]:
+        """Finds the packages matching the query, best matches first.
+
+        Args:
+            query: Search terms, all of which have to match. Stopwords only have to match if the query consists of
+                   nothing else.
+            languages: Only search localized fields in these languages. Defaults to all languages.
+            limit: Maximum number of hits, or ``None`` for all hits.
+            prefix: Whether query tokens may match the beginning of longer tokens.
+        """
+        allowed_languages = None if languages is None else _with_general_languages(languages)
+        stopwords = frozenset().union(
+            *(
+                stopwords
+                for language, stopwords in _STOPWORDS.items()
+                if allowed_languages is None or language in allowed_languages
+            )
+        )
+        tokens = list(dict.fromkeys(tokenize(query)))
+        # Stopwords are not indexed in localized fields of their language, but in all other fields. So they only add to
+        # the score, unless the query consists of nothing else.
+        required = [token for token in tokens if token not in stopwords] or tokens
+        optional = [token for token in tokens if token not in required]
+
+        with self._lock:
+            scores = self._score_token(required[0], allowed_languages, prefix=prefix) if required else {}
+            for token in required[1:]:
+                if not scores:
+                    break
+                token_scores = self._score_token(token, allowed_languages, prefix=prefix)
+                scores = {
+                    identifier: score + token_scores[identifier]
+                    for identifier, score in scores.items()
+                    if identifier in token_scores
+                }
+            for token in optional if scores else ():
+                token_scores = self._score_token(token, allowed_languages, prefix=prefix)
+                scores = {identifier: score + token_scores.get(identifier, 0) for identifier, score in scores.items()}
+
+        hits = starmap(SearchHit, scores.items())
+        if limit is None:
+            return sorted(hits, key=lambda hit: (-hit.score, hit.identifier))
+        return heapq.nsmallest(limit, hits, key=lambda hit: (-hit.score, hit.identifier))
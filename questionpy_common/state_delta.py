@@ -0,0 +1,172 @@
+#  This file is part of QuestionPy. (https://questionpy.org)
+#  QuestionPy is free software released under terms of the MIT license. See LICENSE.md.
+#  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
+"""Opt-in compact encoding of attempt states relative to the state of their question.
+
+Attempt states often repeat large parts of the question state. Questions whose states are JSON objects can store only
+the differences instead::
+
+    class MyAttempt(BaseAttempt):
+        def export_attempt_state(self) -> str:
+            return encode_attempt_state(self.question.export_question_state(), self._state.model_dump_json())
+
+
+    class MyQuestion(BaseQuestion):
+        def get_attempt(self, attempt_state: str, ...) -> BaseAttempt:
+            state = decode_attempt_state(self.export_question_state(), attempt_state)
+            ...
+
+Attempt states which were not encoded, which are not JSON objects or whose delta would not be smaller are passed
+through unchanged, so the encoding can be introduced without migrating existing attempts. Decoded states are equal to
+the original ones as JSON values, but not necessarily character by character.
+"""
+
+import hashlib
+import json
+from typing import Any, Final
+
+from questionpy_common.constants import MAX_QUESTION_STATE_SIZE
+
+__all__ = ["DELTA_PREFIX", "decode_attempt_state", "encode_attempt_state"]
+
+DELTA_PREFIX: Final[str] = "qpy-delta:1:"
+"""Prefix marking an encoded attempt state. The number is the version of the encoding."""
+
+# A delta node is either [new_value] or {"p": {key: delta node}, "r": [removed keys]}.
+_PATCH = "p"
+_REMOVED = "r"
+
+
+def _digest(question_state: str) -> str:
+    return hashlib.sha256(question_state.encode()).hexdigest()[:16]
+
+
+def _json_equal(first: Any, second: Any) -> bool:
+    # Python considers e.g. True == 1 and 1 == 1.0, which are different JSON values.
+    if type(first) is not type(second):
+        return False
+    if isinstance(first, dict):
+        return first.keys() == second.keys() and all(_json_equal(item, second[key]) for key, item in first.items())
+    if isinstance(first, list):
+        return len(first) == len(second) and all(map(_json_equal, first, second))
+    return first == second
+
+
+def _diff(base: Any, value: Any) -> Any:
+    if not isinstance(base, dict) or not isinstance(value, dict):
+        return [value]
+
+    patch = {
+        key: _diff(base[key], item) if key in base else [item]
+        for key, item in value.items()
+        if key not in base or not _json_equal(base[key], item)
+    }
+    removed = [key for key in base if key not in value]
+    node: dict[str, Any] = {}
+    if patch:
+        node[_PATCH] = patch
+    if removed:
+        node[_REMOVED] = removed
+    return node
+
+
+def _is_patch_node(base: Any, node: Any) -> bool:
+    return (
+        isinstance(base, dict)
+        and isinstance(node, dict)
+        and node.keys() <= {_PATCH, _REMOVED}
+        and isinstance(node.get(_PATCH, {}), dict)
+        and isinstance(node.get(_REMOVED, []), list)
+    )
+
+
+def _patch(base: Any, node: Any) -> Any:
+    if isinstance(node, list) and len(node) == 1:
+        return node[0]
+    if not _is_patch_node(base, node):
+        msg = "The encoded attempt state is malformed."
+        raise ValueError(msg)
+
+    result = {key: item for key, item in base.items() if key not in node.get(_REMOVED, ())}
+    for key, child in node.get(_PATCH, {}).items():
+        result[key] = _patch(base.get(key), child)
+    return result
+
+
+def _check_size(state: str, what: str) -> None:
+    if len(state.encode()) > MAX_QUESTION_STATE_SIZE:
+        msg = f"The {what} is larger than {MAX_QUESTION_STATE_SIZE.human_readable()}."
+        raise ValueError(msg)
+
+
+def _load_object(state: str) -> dict[str, Any] | None:
+    try:
+        value = json.loads(state)
+    except ValueError:
+        return None
+    return value if isinstance(value, dict) else None
+
+
+def encode_attempt_state(question_state: str, attempt_state: str) -> str:
+    """Encodes an attempt state as the difference to the question state.
+
+    Args:
+        question_state: State of the question the attempt belongs to, as exported by
+                        :meth:`BaseQuestion.export_question_state`.
+        attempt_state: Attempt state to encode.
+
+    Returns:
+        The encoded attempt state, or `attempt_state` itself if encoding it would not save any space.
+
+    Raises:
+        ValueError: If the resulting state is larger than :data:`MAX_QUESTION_STATE_SIZE`.
+    """
+    encoded = attempt_state
+    base = _load_object(question_state)
+    value = _load_object(attempt_state) if base is not None else None
+    if base is not None and value is not None:
+        delta = json.dumps(
+            {"base": _digest(question_state), "delta": _diff(base, value)}, separators=(",", ":"), ensure_ascii=False
+        )
+        if len(DELTA_PREFIX.encode()) + len(delta.encode()) < len(attempt_state.encode()):
+            encoded = DELTA_PREFIX + delta
+
+    if encoded is attempt_state and attempt_state.startswith(DELTA_PREFIX):
+        msg = f"Attempt states starting with '{DELTA_PREFIX}' can not be stored unencoded."
+        raise ValueError(msg)
+    _check_size(encoded, "attempt state")
+    return encoded
+
+
+def decode_attempt_state(question_state: str, attempt_state: str) -> str:
+    """Reverses :func:`encode_attempt_state`.
+
+    Args:
+        question_state: The same question state that was used to encode the attempt state.
+        attempt_state: An encoded or unencoded attempt state.
+
+    Returns:
+        The decoded attempt state. Unencoded attempt states are returned unchanged.
+
+    Raises:
+        ValueError: If the attempt state was encoded against a different question state, is malformed, or if the
+                    decoded state is larger than :data:`MAX_QUESTION_STATE_SIZE`.
+    """
+    if not attempt_state.startswith(DELTA_PREFIX):
+        return attempt_state
+
+    encoded = json.loads(attempt_state[len(DELTA_PREFIX) :])
+    if not isinstance(encoded, dict) or "delta" not in encoded:
+        msg = "The encoded attempt state is malformed."
+        raise ValueError(msg)
+    if encoded.get("base") != _digest(question_state):
+        msg = "The attempt state was encoded against a different question state."
+        raise ValueError(msg)
+    base = _load_object(question_state)
+    if base is None:
+        msg = "The question state is not a JSON object."
+        raise ValueError(msg)
+
+    decoded = json.dumps(_patch(base, encoded["delta"]), separators=(",", ":"), ensure_ascii=False)
+    _check_size(decoded, "decoded attempt state")
+    return decoded
@@ -0,0 +1,53 @@
+#  This file is part of QuestionPy. (https://questionpy.org)
+#  QuestionPy is free software released under terms of the MIT license. See LICENSE.md.
+#  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
+"""Loading of models exchanged between trusted parties, like the server and the worker.
+
+Skipping validation of such messages does not save time: pydantic's validation is implemented natively, and building
+the models without it in Python is several times slower than :meth:`BaseModel.model_validate_json`. Messages are
+therefore always validated. :class:`TrustedLoader` additionally validates a random sample of them in strict mode, which
+detects producers that rely on type coercion, e.g. sending numbers as strings.
+"""
+
+import random
+from typing import TypeVar
+
+from pydantic import BaseModel
+
+__all__ = ["TrustedLoader"]
+
+_M = TypeVar("_M", bound=BaseModel)
+
+
+class TrustedLoader:
+    """Loads JSON messages with :meth:`BaseModel.model_validate_json`, validating a random sample of them strictly."""
+
+    def __init__(self, validate_fraction: float = 0.0, *, seed: int | None = None):
+        """Creates a loader.
+
+        Args:
+            validate_fraction: Fraction of messages to validate in strict mode, between 0 (none) and 1 (all).
+            seed: Seed of the random sampling.
+        """
+        if not 0 <= validate_fraction <= 1:
+            msg = "validate_fraction must be between 0 and 1."
+            raise ValueError(msg)
+        self.validate_fraction = validate_fraction
+        self._random = random.Random(seed)
+        self.loaded = 0
+        """Number of messages loaded so far."""
+        self.validated = 0
+        """Number of messages which were validated in strict mode."""
+
+    def load(self, model: type[_M], data: str | bytes) -> _M:
+        """Loads a message, validating it strictly if it is part of the sample.
+
+        Raises:
+            pydantic.ValidationError: If the message is invalid, or if it is part of the sample and relies on type
+                                      coercion.
+        """
+        self.loaded += 1
+        strict = bool(self.validate_fraction) and self._random.random() < self.validate_fraction
+        if strict:
+            self.validated += 1
+        return model.model_validate_json(data, strict=strict)
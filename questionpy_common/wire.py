@@ -0,0 +1,206 @@
+#  This file is part of QuestionPy. (https://questionpy.org)
+#  QuestionPy is free software released under terms of the MIT license. See LICENSE.md.
+#  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
+"""Codecs for exchanging models between the server and the worker.
+
+:class:`JsonCodec` produces the same JSON as :meth:`BaseModel.model_dump_json`. :class:`MsgpackCodec` is a compact
+binary alternative based on MessagePack, which requires the optional ``msgpack`` dependency
+(``pip install questionpy-common[msgpack]``). It stores ``bytes`` natively, encodes the members of the enums in
+:data:`WIRE_ENUMS` as their index and prefixes each message with the API version of the sender (see
+:attr:`Manifest.api_version`). Messages from a different major API version are rejected.
+
+Each side lists the codecs it supports with :func:`supported_media_types`, and the receiving side picks one with
+:func:`negotiate_codec`::
+
+    codec = negotiate_codec(request.headers["Accept"].split(","), api_version="0.1")
+    body = codec.encode(attempt)
+"""
+
+import importlib
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from enum import Enum
+from types import ModuleType
+from typing import Any, ClassVar, Final, TypeVar
+
+from pydantic import BaseModel
+
+from questionpy_common.api.attempt import CacheControl, ScoringCode
+from questionpy_common.api.question import ScoringMethod
+from questionpy_common.manifest import PackageType
+
+__all__ = [
+    "WIRE_ENUMS",
+    "JsonCodec",
+    "MsgpackCodec",
+    "UnsupportedCodecError",
+    "WireCodec",
+    "WireFormatError",
+    "negotiate_codec",
+    "supported_media_types",
+]
+
+_M = TypeVar("_M", bound=BaseModel)
+
+WIRE_ENUMS: Final[tuple[type[Enum], ...]] = (CacheControl, ScoringCode, ScoringMethod, PackageType)
+"""Enums which :class:`MsgpackCodec` encodes as the index of the member.
+
+The position of an enum in this tuple determines its MessagePack extension type code, so new enums must be appended,
+and new members must be appended to their enum.
+"""
+
+_EXT_TYPE_OFFSET = 1
+_enum_codes = {enum: code for code, enum in enumerate(WIRE_ENUMS, _EXT_TYPE_OFFSET)}
+_enum_members = {code: tuple(enum) for code, enum in enumerate(WIRE_ENUMS, _EXT_TYPE_OFFSET)}
+_member_indices = {member: index for enum in WIRE_ENUMS for index, member in enumerate(enum)}
+
+
+class WireFormatError(ValueError):
+    """A message is malformed or was encoded for an incompatible API version."""
+
+
+class UnsupportedCodecError(ValueError):
+    """None of the offered media types is supported."""
+
+
+class WireCodec(ABC):
+    """Encodes models to bytes and decodes them again."""
+
+    media_type: ClassVar[str]
+    """Media type of the encoded messages, used for negotiation."""
+
+    @abstractmethod
+    def encode(self, model: BaseModel) -> bytes:
+        """Encodes a model."""
+
+    @abstractmethod
+    def decode(self, model: type[_M], data: bytes) -> _M:
+        """Decodes and validates a model.
+
+        Raises:
+            WireFormatError: If the message is malformed.
+            pydantic.ValidationError: If the message does not contain a valid model.
+        """
+
+
+class JsonCodec(WireCodec):
+    """The JSON which has always been used. Messages are not versioned."""
+
+    media_type = "application/json"
+
+    def encode(self, model: BaseModel) -> bytes:
+        return model.model_dump_json().encode()
+
+    def decode(self, model: type[_M], data: bytes) -> _M:
+        return model.model_validate_json(data)
+
+
+def _parse_api_version(api_version: str) -> tuple[int, int]:
+    major, _, minor = api_version.partition(".")
+    if not major.isdigit() or not minor.isdigit():
+        msg = f"'{api_version}' is not a valid API version."
+        raise ValueError(msg)
+    return int(major), int(minor)
+
+
+def _import_msgpack() -> ModuleType:
+    try:
+        return importlib.import_module("msgpack")
+    except ImportError as error:
+        msg = "MsgpackCodec requires msgpack. Install it with 'pip install questionpy-common[msgpack]'."
+        raise ImportError(msg) from error
+
+
+class MsgpackCodec(WireCodec):
+    """Compact binary encoding based on MessagePack.
+
+    A message is an array of the sender's major and minor API version and the model, which is encoded like
+    :meth:`BaseModel.model_dump` would return it. Sets and tuples become arrays.
+    """
+
+    media_type = "application/vnd.msgpack"
+
+    def __init__(self, api_version: str):
+        """Creates a codec.
+
+        Args:
+            api_version: The API version of the sending side, e.g. ``"0.1"``.
+
+        Raises:
+            ImportError: If msgpack is not installed.
+        """
+        self._msgpack = _import_msgpack()
+        self.api_version = _parse_api_version(api_version)
+
+    def _default(self, value: Any) -> Any:
+        if isinstance(value, Enum):
+            code = _enum_codes.get(type(value))
+            if code is None:
+                return value.value
+            return self._msgpack.ExtType(code, _member_indices[value].to_bytes())
+        if isinstance(value, set | frozenset | tuple):
+            return list(value)
+        msg = f"Can not encode objects of type '{type(value).__name__}'."
+        raise TypeError(msg)
+
+    def _ext_hook(self, code: int, data: bytes) -> Any:
+        members = _enum_members.get(code)
+        if members is None or len(data) != 1 or data[0] >= len(members):
+            msg = f"Unknown extension type {code} or member {data!r}."
+            raise WireFormatError(msg)
+        return members[data[0]]
+
+    def encode(self, model: BaseModel) -> bytes:
+        major, minor = self.api_version
+        # With strict_types, str enums like PackageType are passed to _default instead of being packed as strings.
+        return self._msgpack.packb([major, minor, model.model_dump()], default=self._default, strict_types=True)
+
+    def decode(self, model: type[_M], data: bytes) -> _M:
+        try:
+            message = self._msgpack.unpackb(data, ext_hook=self._ext_hook)
+        except WireFormatError:
+            raise
+        except (ValueError, self._msgpack.UnpackException) as error:
+            msg = f"The message is not valid MessagePack: {error}"
+            raise WireFormatError(msg) from error
+
+        match message:
+            case [int() as major, int(), dict() as payload] if major == self.api_version[0]:
+                return model.model_validate(payload)
+            case [int() as major, int() as minor, dict()]:
+                msg = f"The message was encoded for API version {major}.{minor}, which is incompatible."
+            case _:
+                msg = "The message is not a versioned model."
+        raise WireFormatError(msg)
+
+
+def supported_media_types() -> list[str]:
+    """Returns the media types of the available codecs, the preferred one first."""
+    try:
+        _import_msgpack()
+    except ImportError:
+        return [JsonCodec.media_type]
+    return [MsgpackCodec.media_type, JsonCodec.media_type]
+
+
+def negotiate_codec(offered: Iterable[str], *, api_version: str) -> WireCodec:
+    """Picks the codec for the first of the offered media types which is available.
+
+    Args:
+        offered: Media types supported by the other side, in order of its preference. Parameters like ``;q=0.5`` are
+                 ignored.
+        api_version: The own API version, used by versioned codecs.
+
+    Raises:
+        UnsupportedCodecError: If none of the offered media types is available.
+    """
+    available = supported_media_types()
+    for offer in offered:
+        media_type = offer.partition(";")[0].strip().lower()
+        if media_type == MsgpackCodec.media_type and media_type in available:
+            return MsgpackCodec(api_version)
+        if media_type == JsonCodec.media_type:
+            return JsonCodec()
+
+    msg = f"None of the offered media types is supported. Supported are: {', '.join(available)}."
+    raise UnsupportedCodecError(msg)
@@ -0,0 +1,141 @@
+#  This file is part of QuestionPy. (https://questionpy.org)
+#  QuestionPy is free software released under terms of the MIT license. See LICENSE.md.
+#  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
+from pathlib import Path
+
+import pytest
+
+from questionpy_common.api.attempt import AttemptUi, UiFile
+from questionpy_common.assets import AssetBundleCache
+from questionpy_common.manifest import Manifest
+
+
+class _Package:
+    def __init__(self, root: Path, version: str = "1.0.0") -> None:
+        self.root = root
+        self.manifest = Manifest(short_name="example", namespace="ns", version=version, api_version="0.1", author="x")
+        self.reads = 0
+
+    def get_path(self, path: str) -> Path:
+        self.reads += 1
+        return self.root / path
+
+
+@pytest.fixture
+def package(tmp_path: Path) -> _Package:
+    (tmp_path / "style.css").write_text("p { color: red; }")
+    return _Package(tmp_path)
+
+
+_UI = AttemptUi(
+    content="<div/>",
+    include_css_file="style.css",
+    include_inline_css=".a { margin: 0; }",
+    files=[UiFile(name="image.svg", data="<svg/>"), UiFile(name="data", data="abc", mime_type="text/plain")],
+)
+
+
+def test_builds_bundle(package: _Package) -> None:
+    bundle = AssetBundleCache().get(package, _UI)
+
+    assert bundle.stylesheet is not None
+    assert bundle.stylesheet.data == b"p { color: red; }\n.a { margin: 0; }"
+    assert bundle.stylesheet.media_type == "text/css"
+    assert bundle.files["image.svg"].data == b"<svg/>"
+    assert bundle.files["image.svg"].media_type == "image/svg+xml"
+    assert bundle.files["data"].media_type == "text/plain"
+    assert bundle.etag.startswith('"')
+    assert bundle.etag.endswith('"')
+
+
+def test_bundle_without_assets(package: _Package) -> None:
+    bundle = AssetBundleCache().get(package, AttemptUi(content="<div/>"))
+
+    assert bundle.stylesheet is None
+    assert bundle.files == {}
+
+
+def test_reuses_bundles(package: _Package) -> None:
+    cache = AssetBundleCache()
+    bundle = cache.get(package, _UI)
+
+    assert cache.get(package, _UI.model_copy()) is bundle
+    assert package.reads == 1
+    assert len(cache) == 1
+
+
+def test_reuses_bundles_of_equal_files(package: _Package) -> None:
+    cache = AssetBundleCache()
+    bundle = cache.get(package, _UI)
+
+    assert cache.get(package, AttemptUi.model_validate(_UI.model_dump())) is bundle
+
+
+def test_etags_depend_on_names_and_media_types() -> None:
+    package = _Package(Path())
+    cache = AssetBundleCache()
+    bundle = cache.get(package, AttemptUi(content="", files=[UiFile(name="a", data="x", mime_type="text/plain")]))
+    renamed = cache.get(package, AttemptUi(content="", files=[UiFile(name="b", data="x", mime_type="text/plain")]))
+    retyped = cache.get(package, AttemptUi(content="", files=[UiFile(name="a", data="x", mime_type="text/html")]))
+
+    assert renamed.files["b"].etag == bundle.files["a"].etag
+    assert retyped.files["a"].etag != bundle.files["a"].etag
+    assert len({bundle.etag, renamed.etag, retyped.etag}) == 3
+
+
+def test_etags_depend_on_content(package: _Package) -> None:
+    cache = AssetBundleCache()
+    bundle = cache.get(package, _UI)
+    other = cache.get(package, _UI.model_copy(update={"include_inline_css": ".b {}"}))
+
+    assert other.stylesheet is not None
+    assert bundle.stylesheet is not None
+    assert other.stylesheet.etag != bundle.stylesheet.etag
+    assert other.files["image.svg"].etag == bundle.files["image.svg"].etag
+    assert other.etag != bundle.etag
+
+
+def test_new_package_version_drops_bundles(package: _Package) -> None:
+    cache = AssetBundleCache()
+    cache.get(package, _UI)
+    (package.root / "style.css").write_text("p {}")
+
+    updated = _Package(package.root, version="1.0.1")
+    stylesheet = cache.get(updated, _UI).stylesheet
+
+    assert stylesheet is not None
+    assert stylesheet.data.startswith(b"p {}")
+    assert len(cache) == 1
+
+
+def test_invalidate(package: _Package) -> None:
+    cache = AssetBundleCache()
+    cache.get(package, _UI)
+    cache.get(package, AttemptUi(content=""))
+
+    cache.invalidate(package.manifest.identifier)
+    assert len(cache) == 0
+
+    cache.get(package, _UI)
+    cache.invalidate(package)
+    assert len(cache) == 0
+
+
+def test_evicts_least_recently_used(package: _Package) -> None:
+    cache = AssetBundleCache(max_bundles=2)
+    first = cache.get(package, AttemptUi(content="", include_inline_css="a"))
+    cache.get(package, AttemptUi(content="", include_inline_css="b"))
+    cache.get(package, AttemptUi(content="", include_inline_css="a"))
+    cache.get(package, AttemptUi(content="", include_inline_css="c"))
+
+    assert len(cache) == 2
+    assert cache.get(package, AttemptUi(content="", include_inline_css="a")) is first
+
+
+def test_missing_css_file_is_not_cached(package: _Package) -> None:
+    cache = AssetBundleCache()
+    ui = AttemptUi(content="", include_css_file="missing.css")
+
+    with pytest.raises(FileNotFoundError):
+        cache.get(package, ui)
+    assert len(cache) == 0
@@ -0,0 +1,147 @@
+#  This file is part of QuestionPy. (https://questionpy.org)
+#  QuestionPy is free software released under terms of the MIT license. See LICENSE.md.
+#  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, Semaphore
+from typing import ClassVar
+
+import pytest
+
+from questionpy_common.api.attempt import AttemptModel, AttemptScoredModel, AttemptUi, BaseAttempt
+from questionpy_common.api.question import BaseQuestion, QuestionModel, ScoringMethod
+from questionpy_common.attempt_pool import AttemptPool
+
+
+class _Attempt(BaseAttempt):
+    def __init__(self, variant: int, number: int):
+        self.variant = variant
+        self.number = number
+
+    def export_attempt_state(self) -> str:
+        return f"{self.variant}-{self.number}"
+
+    def export(self) -> AttemptModel:
+        return AttemptModel(variant=self.variant, ui=AttemptUi(content=f"<div>{self.number}</div>"))
+
+    def export_scored_attempt(self) -> AttemptScoredModel:
+        raise NotImplementedError
+
+
+class _Question(BaseQuestion):
+    def __init__(self) -> None:
+        self.started = 0
+
+    def start_attempt(self, variant: int) -> BaseAttempt:
+        self.started += 1
+        return _Attempt(variant, self.started)
+
+    def get_attempt(self, *_: object, **__: object) -> BaseAttempt:  # type: ignore[override]
+        raise NotImplementedError
+
+    def export_question_state(self) -> str:
+        return "{}"
+
+    def export(self) -> QuestionModel:
+        return QuestionModel(num_variants=2, scoring_method=ScoringMethod.AUTOMATICALLY_SCORABLE)
+
+
+class _DeterministicQuestion(_Question):
+    deterministic_start_attempt: ClassVar[bool] = True
+
+
+class _BlockingQuestion(_Question):
+    def __init__(self) -> None:
+        super().__init__()
+        self.entered = Semaphore(0)
+        self.release = Event()
+
+    def start_attempt(self, variant: int) -> BaseAttempt:
+        self.entered.release()
+        self.release.wait()
+        return super().start_attempt(variant)
+
+
+def test_prewarm_and_take() -> None:
+    question = _Question()
+    pool = AttemptPool(question, size=3)
+    pool.prewarm()
+
+    assert question.started == 6
+    assert pool.available(1) == pool.available(2) == 3
+
+    started = pool.take(2)
+    assert started.attempt_state == "2-4"
+    assert started.attempt.variant == 2
+    assert pool.available(2) == 2
+
+
+def test_take_from_empty_pool_starts_synchronously() -> None:
+    question = _Question()
+    pool = AttemptPool(question, size=2)
+
+    assert [pool.take(1).attempt_state for _ in range(3)] == ["1-1", "1-2", "1-3"]
+    assert pool.available(1) == 0
+
+    pool.prewarm([1])
+    pool.clear()
+    assert pool.available(1) == 0
+
+
+def test_deterministic_question_reuses_attempt() -> None:
+    question = _DeterministicQuestion()
+    pool = AttemptPool(question, size=10)
+    pool.prewarm()
+
+    assert question.started == 2
+    assert pool.take(1) is pool.take(1)
+    assert question.started == 2
+
+
+def test_refill_in_background() -> None:
+    question = _Question()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pool = AttemptPool(question, size=2, executor=executor)
+        pool.take(1)
+    assert pool.available(1) == 2
+    assert question.started == 3
+
+
+def test_clear_discards_attempts_being_started() -> None:
+    question = _BlockingQuestion()
+    pool = AttemptPool(question, size=1)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(pool.prewarm, [1])
+        question.entered.acquire()
+
+        pool.clear()
+        question.release.set()
+        future.result()
+
+    # Only the attempt started after clearing the pool is kept.
+    assert question.started == 2
+    assert pool.available(1) == 1
+    assert pool.take(1).attempt_state == "1-2"
+
+
+def test_concurrent_prewarm_does_not_overfill() -> None:
+    question = _BlockingQuestion()
+    pool = AttemptPool(question, size=2)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(pool.prewarm, [1]) for _ in range(4)]
+        question.entered.acquire()
+        question.entered.acquire()
+        question.release.set()
+        for future in futures:
+            future.result()
+
+    assert pool.available(1) == 2
+    assert question.started == 2
+
+
+@pytest.mark.parametrize("variant", [0, 3])
+def test_invalid_variant_should_raise(variant: int) -> None:
+    pool = AttemptPool(_Question())
+    with pytest.raises(ValueError, match=f"Variant {variant} does not exist"):
+        pool.take(variant)
+    with pytest.raises(ValueError, match=f"Variant {variant} does not exist"):
+        pool.prewarm([variant])
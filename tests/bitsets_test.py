@@ -0,0 +1,96 @@
+#  This file is part of QuestionPy. (https://questionpy.org)
+#  QuestionPy is free software released under terms of the MIT license. See LICENSE.md.
+#  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
+import pytest
+
+from questionpy_common.bitsets import BitRegistry, ManifestBitsetIndex, iter_bits
+from questionpy_common.manifest import Manifest
+
+
+def _manifest(short_name: str, permissions: set[str], tags: set[str] | None = None) -> Manifest:
+    return Manifest(
+        short_name=short_name,
+        version="0.1.0",
+        api_version="0.1",
+        author="John Doe",
+        permissions=permissions,
+        tags=tags or set(),
+    )
+
+
+def test_iter_bits() -> None:
+    assert list(iter_bits(0)) == []
+    assert list(iter_bits(0b1010_0001)) == [0, 5, 7]
+    assert list(iter_bits(1 << 200)) == [200]
+
+
+def test_bit_registry() -> None:
+    registry = BitRegistry(["a", "b"])
+
+    assert registry.bit("b") == 1
+    assert registry.bit("c") == 2
+    assert len(registry) == 3
+    assert registry.mask(["a", "c"]) == 0b101
+    assert registry.mask(["a", "unknown"], register=False) == 0b1
+    assert "unknown" not in registry
+    assert registry.strings(0b110) == {"b", "c"}
+
+
+@pytest.fixture
+def index() -> ManifestBitsetIndex:
+    return ManifestBitsetIndex([
+        _manifest("none", set(), {"math"}),
+        _manifest("network", {"network"}, {"math", "graph"}),
+        _manifest("files", {"files"}, {"graph"}),
+        _manifest("both", {"files", "network"}),
+    ])
+
+
+def test_manifest_bits(index: ManifestBitsetIndex) -> None:
+    bits = index.get("@local/both")
+
+    assert index.permissions.strings(bits.permissions) == {"files", "network"}
+    assert bits.requires_only(index.permissions.mask(["files", "network", "other"]))
+    assert not bits.requires_only(index.permissions.mask(["files"]))
+    assert index.get("@local/network").has_all_tags(index.tags.mask(["math", "graph"]))
+    assert not index.get("@local/files").has_any_tag(index.tags.mask(["math"]))
+
+
+@pytest.mark.parametrize(
+    ("criteria", "expected"),
+    [
+        ({}, ["none", "network", "files", "both"]),
+        ({"allowed_permissions": []}, ["none"]),
+        ({"allowed_permissions": ["network", "unknown"]}, ["none", "network"]),
+        ({"all_tags": ["math", "graph"]}, ["network"]),
+        ({"all_tags": ["math", "unknown"]}, []),
+        ({"any_tags": ["math", "graph"]}, ["none", "network", "files"]),
+        ({"allowed_permissions": ["files"], "any_tags": ["graph"]}, ["files"]),
+    ],
+)
+def test_filter(index: ManifestBitsetIndex, criteria: dict, expected: list[str]) -> None:
+    assert index.filter(**criteria) == [f"@local/{name}" for name in expected]
+
+
+def test_add_replaces_and_remove(index: ManifestBitsetIndex) -> None:
+    index.add(_manifest("none", {"files"}))
+    index.remove("@local/network")
+    index.remove("@local/does_not_exist")
+
+    assert len(index) == 3
+    assert "@local/network" not in index
+    assert index.filter(allowed_permissions=["files"]) == ["@local/files", "@local/none"]
+    with pytest.raises(KeyError):
+        index.get("@local/network")
+
+
+def test_removed_slots_are_compacted() -> None:
+    index = ManifestBitsetIndex()
+    for i in range(500):
+        index.add(_manifest(f"p{i}", {f"perm{i % 3}"}))
+        if i % 10:
+            index.remove(f"@local/p{i}")
+
+    assert len(index) == 50
+    assert len(index.filter(allowed_permissions=["perm0"])) == 17
+    assert index.filter(allowed_permissions=["perm1", "perm2"])[:2] == ["@local/p10", "@local/p20"]
@@ -0,0 +1,148 @@
+#  This file is part of QuestionPy. (https://questionpy.org)
+#  QuestionPy is free software released under terms of the MIT license. See LICENSE.md.
+#  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
+import pytest
+
+from questionpy_common.condition_graph import (
+    ConditionCycleError,
+    ConditionEvaluator,
+    ConditionGraph,
+    ConditionState,
+    evaluate_condition,
+)
+from questionpy_common.conditions import Condition, DoesNotEqual, Equals, In, IsChecked, IsNotChecked
+from questionpy_common.dev.factories import FormGenerator, FormGeneratorOptions
+from questionpy_common.elements import (
+    CheckboxElement,
+    FormSection,
+    GroupElement,
+    OptionsFormDefinition,
+    TextInputElement,
+)
+
+_DEFINITION = OptionsFormDefinition(
+    general=[
+        CheckboxElement(name="enable"),
+        TextInputElement(name="input", label="", disable_if=[IsNotChecked(name="enable")]),
+        GroupElement(
+            name="group",
+            label="",
+            elements=[TextInputElement(name="nested", label="", hide_if=[Equals(name="input", value="hide")])],
+        ),
+    ],
+    sections=[
+        FormSection(
+            name="section",
+            header="",
+            elements=[
+                TextInputElement(
+                    name="last",
+                    label="",
+                    disable_if=[IsChecked(name="enable")],
+                    hide_if=[In(name="nested", value=[1, 2])],
+                )
+            ],
+        )
+    ],
+)
+
+
+@pytest.mark.parametrize(
+    ("condition", "value", "expected"),
+    [
+        (IsChecked(name="x"), True, True),
+        (IsChecked(name="x"), "1", True),
+        (IsChecked(name="x"), "0", False),
+        (IsChecked(name="x"), None, False),
+        (IsNotChecked(name="x"), False, True),
+        (IsNotChecked(name="x"), "1", False),
+        (Equals(name="x", value=3), "3", True),
+        (Equals(name="x", value="a"), "b", False),
+        (DoesNotEqual(name="x", value="a"), "b", True),
+        (DoesNotEqual(name="x", value="a"), None, True),
+        (In(name="x", value=["a", 2]), "2", True),
+        (In(name="x", value=["a", 2]), "c", False),
+        (In(name="x", value=["a"]), ["a", "b"], True),
+        (In(name="x", value=["c"]), ["a", "b"], False),
+        (Equals(name="x", value="b"), ["a", "b"], True),
+        (DoesNotEqual(name="x", value="b"), ["a", "b"], False),
+        (DoesNotEqual(name="x", value="c"), [], True),
+        (Equals(name="x", value=1), True, False),
+        (Equals(name="x", value=0), False, False),
+        (Equals(name="x", value=True), 1, False),
+        (Equals(name="x", value=True), "1", True),
+        (Equals(name="x", value=True), True, True),
+        (Equals(name="x", value=False), "0", True),
+        (Equals(name="x", value=False), "1", False),
+        (Equals(name="x", value=1), "1", True),
+    ],
+)
+def test_evaluate_condition(condition: Condition, value: object, *, expected: bool) -> None:
+    assert evaluate_condition(condition, value) is expected
+
+
+def test_graph() -> None:
+    graph = ConditionGraph.from_definition(_DEFINITION)
+
+    assert set(graph.elements) == {"input", "nested", "last"}
+    assert graph.dependencies("last") == {"enable", "nested"}
+    assert graph.dependents("enable") == {"input", "last"}
+    assert graph.transitive_dependents(["enable"]) == {"input", "nested", "last"}
+    assert graph.find_cycles() == []
+
+    order = graph.topological_order()
+    assert set(order) == {"enable", "input", "nested", "last"}
+    assert order.index("enable") < order.index("input") < order.index("nested") < order.index("last")
+
+
+def test_cycles() -> None:
+    graph = ConditionGraph([
+        TextInputElement(name="a", label="", disable_if=[Equals(name="b", value="")]),
+        TextInputElement(name="b", label="", disable_if=[Equals(name="c", value="")]),
+        TextInputElement(name="c", label="", hide_if=[Equals(name="a", value="")]),
+        TextInputElement(name="d", label="", hide_if=[Equals(name="d", value="")]),
+        TextInputElement(name="e", label="", hide_if=[Equals(name="a", value="")]),
+    ])
+
+    assert sorted(sorted(cycle) for cycle in graph.find_cycles()) == [["a", "b", "c"], ["d"]]
+    with pytest.raises(ConditionCycleError) as exc_info:
+        graph.topological_order()
+    assert len(exc_info.value.cycles) == 2
+
+
+def test_duplicate_names_should_raise() -> None:
+    element = TextInputElement(name="a", label="", disable_if=[IsChecked(name="b")])
+    with pytest.raises(ValueError, match="'a'"):
+        ConditionGraph([element, GroupElement(name="g", label="", elements=[element])])
+
+
+def test_evaluator_only_reports_changed_states() -> None:
+    evaluator = ConditionEvaluator(ConditionGraph.from_definition(_DEFINITION), {"enable": True})
+    assert evaluator.states == {
+        "input": ConditionState(),
+        "nested": ConditionState(),
+        "last": ConditionState(disabled=True),
+    }
+
+    assert evaluator.update({"enable": True}) == {}
+    assert evaluator.update({"enable": False, "input": "hide"}) == {
+        "input": ConditionState(disabled=True),
+        "nested": ConditionState(hidden=True),
+        "last": ConditionState(),
+    }
+    assert evaluator.update({"nested": "2"}) == {"last": ConditionState(hidden=True)}
+    assert evaluator.state("enable") == ConditionState()
+
+
+def test_incremental_evaluation_matches_full_evaluation() -> None:
+    options = FormGeneratorOptions(depth=2, condition_density=0.8, num_options=3)
+    definition = FormGenerator(seed=5, options=options).build(num_general=200)
+    graph = ConditionGraph.from_definition(definition)
+    graph.topological_order()
+
+    evaluator = ConditionEvaluator(graph)
+    values: dict[str, object] = {}
+    for name in list(graph.elements)[:50]:
+        values[name] = f"{name}_1"
+        evaluator.update({name: values[name]})
+    assert evaluator.states == ConditionEvaluator(graph, values).states
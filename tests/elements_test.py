@@ -2,20 +2,24 @@
 #  QuestionPy is free software released under terms of the MIT license. See LICENSE.md.
 #  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
 
+import itertools
 
 import pytest
 from polyfactory.factories.pydantic_factory import ModelFactory
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
 from questionpy_common.dev.factories import (
     CheckboxElementFactory,
     CheckboxGroupElementFactory,
+    FormGenerator,
+    FormGeneratorOptions,
     FormSectionFactory,
     GroupElementFactory,
     HiddenElementFactory,
     OptionFactory,
     OptionsFormDefinitionFactory,
     RadioGroupElementFactory,
+    RepetitionElementFactory,
     SelectElementFactory,
     StaticTextElementFactory,
     TextInputElementFactory,
@@ -28,8 +32,10 @@ from questionpy_common.elements import (
     GroupElement,
     HiddenElement,
     Option,
+    OptionList,
     OptionsFormDefinition,
     RadioGroupElement,
+    RepetitionElement,
     SelectElement,
     StaticTextElement,
     TextInputElement,
@@ -49,6 +55,7 @@ from questionpy_common.elements import (
         (SelectElementFactory, SelectElement),
         (HiddenElementFactory, HiddenElement),
         (GroupElementFactory, GroupElement),
+        (RepetitionElementFactory, RepetitionElement),
         (FormSectionFactory, FormSection),
         (OptionsFormDefinitionFactory, OptionsFormDefinition),
     ],
@@ -70,6 +77,7 @@ def test_factory_builds_valid_model(factory: ModelFactory, model: type[BaseModel
         (SelectElementFactory, SelectElement),
         (HiddenElementFactory, HiddenElement),
         (GroupElementFactory, GroupElement),
+        (RepetitionElementFactory, RepetitionElement),
         (FormSectionFactory, FormSection),
         (OptionsFormDefinitionFactory, OptionsFormDefinition),
     ],
@@ -91,6 +99,7 @@ def test_ignore_additional_properties(factory: ModelFactory, model: type[BaseMod
         SelectElementFactory,
         HiddenElementFactory,
         GroupElementFactory,
+        RepetitionElementFactory,
     ],
 )
 def test_is_form_element_should_return_true(factory: ModelFactory) -> None:
@@ -109,3 +118,123 @@ def test_is_form_element_should_return_true(factory: ModelFactory) -> None:
 )
 def test_is_form_element_should_return_false(instance: object) -> None:
     assert not is_form_element(instance)
+
+
+def _max_depth(elements: list) -> int:
+    return max(
+        (1 + _max_depth(element.elements) if hasattr(element, "elements") else 0 for element in elements), default=0
+    )
+
+
+def test_form_generator_is_deterministic() -> None:
+    first = FormGenerator(seed=42).build(num_general=20, num_sections=3)
+    second = FormGenerator(seed=42).build(num_general=20, num_sections=3)
+    assert first == second
+    assert first != FormGenerator(seed=43).build(num_general=20, num_sections=3)
+
+
+def test_form_generator_respects_options() -> None:
+    options = FormGeneratorOptions(depth=3, fan_out=2, container_probability=1, num_options=7, condition_density=1)
+    form = FormGenerator(seed=1, options=options).build(num_general=10, num_sections=1)
+
+    assert len(form.general) == 10
+    assert len(form.sections[0].elements) == 2
+    assert _max_depth(form.general) == 3
+    assert {element.kind for element in form.general} == {"group", "repetition"}
+
+
+def _assert_conditions_in_scope(elements: list, visible: set[str]) -> None:
+    for element in elements:
+        for condition in getattr(element, "disable_if", []) + getattr(element, "hide_if", []):
+            assert condition.name in visible
+        if isinstance(element, RepetitionElement):
+            _assert_conditions_in_scope(element.elements, set(visible))
+        elif isinstance(element, GroupElement):
+            _assert_conditions_in_scope(element.elements, visible)
+        visible.add(element.name)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_form_generator_conditions_refer_to_elements_in_scope(seed: int) -> None:
+    options = FormGeneratorOptions(depth=3, fan_out=3, container_probability=0.5, condition_density=1)
+    form = FormGenerator(seed=seed, options=options).build(num_general=30)
+
+    _assert_conditions_in_scope(form.general, set())
+
+
+def test_form_generator_streams_elements() -> None:
+    options = FormGeneratorOptions(depth=0, condition_density=1)
+    elements = FormGenerator(seed=0, options=options).iter_elements()
+    names = set()
+    for element in itertools.islice(elements, 1000):
+        assert is_form_element(element)
+        assert element.name not in names
+        names.add(element.name)
+        for condition in getattr(element, "disable_if", []) + getattr(element, "hide_if", []):
+            assert condition.name in names
+
+
+_OPTIONS = [Option(label="A", value="a"), Option(label="B", value="b", selected=True), Option(label="C", value="a")]
+
+
+def test_option_list_behaves_like_list_of_options() -> None:
+    options = OptionList(_OPTIONS)
+
+    assert options == _OPTIONS
+    assert list(options) == _OPTIONS
+    assert options[1] == _OPTIONS[1]
+    assert options[-1] == _OPTIONS[-1]
+    assert options[1:] == _OPTIONS[1:]
+    assert isinstance(options[1:], OptionList)
+    assert _OPTIONS[2] in options
+    assert Option(label="C", value="b") not in options
+    assert options.selected_values == ["b"]
+    with pytest.raises(IndexError):
+        options[3]
+
+
+def test_option_list_value_lookup() -> None:
+    options = OptionList(_OPTIONS)
+
+    assert options.has_value("a")
+    assert not options.has_value("c")
+    assert options.index_of_value("a") == 0
+    with pytest.raises(ValueError, match="'c'"):
+        options.index_of_value("c")
+
+
+@pytest.mark.parametrize("model", [RadioGroupElement, SelectElement])
+def test_options_are_validated_into_mutable_list(model: type[RadioGroupElement | SelectElement]) -> None:
+    element = model.model_validate({"name": "n", "label": "l", "options": [option.model_dump() for option in _OPTIONS]})
+
+    assert isinstance(element.options, list)
+    element.options[0].selected = True
+    element.options.append(Option(label="D", value="d"))
+    assert element.model_dump()["options"][0]["selected"]
+    assert len(element.model_dump()["options"]) == len(_OPTIONS) + 1
+
+
+@pytest.mark.parametrize("model", [RadioGroupElement, SelectElement])
+def test_option_list_serializes_like_list(model: type[RadioGroupElement | SelectElement]) -> None:
+    with_list = model(name="n", label="l", options=[Option(label="A", value="a"), *_OPTIONS[1:]])
+    with_option_list = model(name="n", label="l", options=OptionList(_OPTIONS))
+
+    assert isinstance(with_option_list.options, OptionList)
+    assert with_option_list == with_list
+    for kwargs in ({}, {"mode": "json"}, {"exclude_unset": True}, {"exclude_defaults": True}):
+        assert with_option_list.model_dump(**kwargs) == with_list.model_dump(**kwargs)
+    assert with_option_list.model_dump_json() == with_list.model_dump_json()
+
+
+def test_shared_option_lists() -> None:
+    shared = OptionList.shared(_OPTIONS)
+
+    assert OptionList.shared([option.model_copy() for option in _OPTIONS]) is shared
+    assert SelectElement(name="n", label="l", options=shared).options is shared
+
+
+def test_invalid_options_are_reported_like_list() -> None:
+    with pytest.raises(ValidationError) as info:
+        SelectElement.model_validate({"name": "n", "label": "l", "options": [{"label": "A"}]})
+
+    assert info.value.errors()[0]["loc"] == ("options", 0, "value")
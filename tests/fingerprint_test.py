@@ -0,0 +1,140 @@
+#  This file is part of QuestionPy. (https://questionpy.org)
+#  QuestionPy is free software released under terms of the MIT license. See LICENSE.md.
+#  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
+import gc
+
+import pytest
+from pydantic import BaseModel
+
+from questionpy_common.api.question import QuestionModel, ScoringMethod
+from questionpy_common.dev.factories import FormGenerator
+from questionpy_common.elements import (
+    FormSection,
+    HiddenElement,
+    Option,
+    OptionList,
+    OptionsFormDefinition,
+    SelectElement,
+    StaticTextElement,
+    TextInputElement,
+)
+from questionpy_common.fingerprint import FINGERPRINT_SIZE, Fingerprinter, fingerprint
+from questionpy_common.manifest import Manifest
+
+
+def test_equal_models_have_equal_fingerprints() -> None:
+    form = FormGenerator(seed=1).build(50, 5)
+    copy = OptionsFormDefinition.model_validate(form.model_dump())
+
+    assert copy is not form
+    assert fingerprint(copy) == fingerprint(form)
+    assert len(fingerprint(form)) == FINGERPRINT_SIZE
+
+
+@pytest.mark.parametrize(
+    ("first", "second"),
+    [
+        (TextInputElement(name="a", label="b"), TextInputElement(name="a", label="c")),
+        (TextInputElement(name="a", label="b"), StaticTextElement(name="a", label="b", text="")),
+        (HiddenElement(name="ab", value=""), HiddenElement(name="a", value="b")),
+        (TextInputElement(name="a", label="b"), TextInputElement(name="a", label="b", required=True)),
+        (
+            QuestionModel(scoring_method=ScoringMethod.AUTOMATICALLY_SCORABLE, penalty=1),
+            QuestionModel(scoring_method=ScoringMethod.AUTOMATICALLY_SCORABLE, penalty=None),
+        ),
+        (
+            QuestionModel(scoring_method=ScoringMethod.AUTOMATICALLY_SCORABLE),
+            QuestionModel(scoring_method=ScoringMethod.ALWAYS_MANUAL_SCORING_REQUIRED),
+        ),
+    ],
+)
+def test_different_models_have_different_fingerprints(first: BaseModel, second: BaseModel) -> None:
+    assert fingerprint(first) != fingerprint(second)
+
+
+def test_order_of_sets_and_dicts_is_ignored() -> None:
+    manifest = Manifest(
+        short_name="a",
+        version="1.0.0",
+        api_version="0.1",
+        author="x",
+        tags={"a", "b", "c"},
+        name={"en": "A", "de": "B"},
+    )
+    reordered = manifest.model_copy(update={"tags": {"c", "b", "a"}, "name": {"de": "B", "en": "A"}})
+
+    assert fingerprint(manifest) == fingerprint(reordered)
+
+
+def test_option_lists_have_the_fingerprint_of_lists() -> None:
+    options = [Option(label="A", value="a", selected=True), Option(label="B", value="a")]
+
+    assert fingerprint(SelectElement(name="s", label="S", options=OptionList(options))) == fingerprint(
+        SelectElement(name="s", label="S", options=options)
+    )
+
+
+def test_unchanged_subtrees_are_not_hashed_again() -> None:
+    fingerprinter = Fingerprinter()
+    form = FormGenerator(seed=2).build(20, 3)
+    fingerprinter(form)
+    memoized = len(fingerprinter)
+
+    changed_section = form.sections[1].model_copy(update={"header": "Changed"})
+    changed = form.model_copy(update={"sections": [form.sections[0], changed_section, form.sections[2]]})
+
+    assert fingerprinter(changed) != fingerprinter(form)
+    assert len(fingerprinter) == memoized + 2
+    assert fingerprinter(changed.sections[0]) == fingerprinter(form.sections[0])
+
+
+def test_fingerprint_is_not_memoized_across_calls() -> None:
+    form = FormGenerator(seed=5).build(5, 1)
+    before = fingerprint(form)
+
+    form.sections[0].elements.append(TextInputElement(name="new", label="New"))
+
+    assert fingerprint(form) != before
+
+
+def test_invalidate_after_mutation() -> None:
+    fingerprinter = Fingerprinter()
+    section = FormSection(name="s", header="S", elements=[TextInputElement(name="a", label="b")])
+    before = fingerprinter(section)
+
+    section.header = "Changed"
+    assert fingerprinter(section) == before
+
+    fingerprinter.invalidate(section)
+    assert fingerprinter(section) != before
+
+
+def test_invalidate_root_after_mutating_descendant() -> None:
+    fingerprinter = Fingerprinter()
+    form = FormGenerator(seed=4).build(10, 2)
+    before = fingerprinter(form)
+    section_before = fingerprinter(form.sections[1])
+
+    form.sections[1].elements.append(TextInputElement(name="new", label="New"))
+    fingerprinter.invalidate(form)
+
+    assert fingerprinter(form) != before
+    assert fingerprinter(form.sections[1]) != section_before
+    assert fingerprinter(form) == Fingerprinter()(OptionsFormDefinition.model_validate(form.model_dump()))
+
+
+def test_memo_entries_are_removed_with_the_models() -> None:
+    fingerprinter = Fingerprinter()
+    fingerprinter(FormGenerator(seed=3).build(10))
+    gc.collect()
+
+    assert len(fingerprinter) == 0
+
+
+class _Opaque(BaseModel):
+    value: object
+
+
+def test_unsupported_values_raise_type_error() -> None:
+    with pytest.raises(TypeError, match="object"):
+        Fingerprinter()(_Opaque(value=object()))
@@ -0,0 +1,163 @@
+#  This file is part of QuestionPy. (https://questionpy.org)
+#  QuestionPy is free software released under terms of the MIT license. See LICENSE.md.
+#  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
+from typing import Any
+
+import pytest
+
+from questionpy_common.elements import (
+    CheckboxElement,
+    CheckboxGroupElement,
+    FormSection,
+    GroupElement,
+    Option,
+    OptionsFormDefinition,
+    RepetitionElement,
+    SelectElement,
+    StaticTextElement,
+    TextInputElement,
+)
+from questionpy_common.form_data import FormDataCodec
+
+_OPTIONS = [Option(label="A", value="a"), Option(label="B", value="b")]
+
+_DEFINITION = OptionsFormDefinition(
+    general=[
+        StaticTextElement(name="static", label="", text=""),
+        TextInputElement(name="input", label=""),
+        CheckboxGroupElement(name="checkboxes", checkboxes=[CheckboxElement(name="cb1"), CheckboxElement(name="cb2")]),
+        GroupElement(
+            name="group", label="", elements=[SelectElement(name="multi", label="", multiple=True, options=_OPTIONS)]
+        ),
+    ],
+    sections=[
+        FormSection(
+            name="section",
+            header="",
+            elements=[
+                RepetitionElement(
+                    name="answers",
+                    initial_repetitions=2,
+                    increment=1,
+                    elements=[
+                        TextInputElement(name="answer", label=""),
+                        SelectElement(name="grade", label="", options=_OPTIONS),
+                        RepetitionElement(
+                            name="feedback",
+                            initial_repetitions=1,
+                            increment=1,
+                            elements=[TextInputElement(name="text", label="")],
+                        ),
+                    ],
+                )
+            ],
+        )
+    ],
+)
+
+_NESTED: dict[str, Any] = {
+    "input": "Some text",
+    "cb1": "1",
+    "cb2": "0",
+    "group": {"multi": ["a", "b"]},
+    "section": {
+        "answers": [
+            {"answer": "First", "grade": "a", "feedback": [{"text": "Good"}, {"text": "Very good"}]},
+            {"answer": "Second", "grade": "b", "feedback": []},
+        ]
+    },
+}
+
+_FLAT = {
+    "input": "Some text",
+    "cb1": "1",
+    "cb2": "0",
+    "group[multi][0]": "a",
+    "group[multi][1]": "b",
+    "section[answers][0][answer]": "First",
+    "section[answers][0][grade]": "a",
+    "section[answers][0][feedback][0][text]": "Good",
+    "section[answers][0][feedback][1][text]": "Very good",
+    "section[answers][1][answer]": "Second",
+    "section[answers][1][grade]": "b",
+}
+
+
+def test_flatten() -> None:
+    assert dict(FormDataCodec(_DEFINITION).flatten(_NESTED)) == _FLAT
+
+
+def test_unflatten() -> None:
+    nested = {
+        **_NESTED,
+        "section": {"answers": [{**_NESTED["section"]["answers"][0]}, {"answer": "Second", "grade": "b"}]},
+    }
+    assert FormDataCodec(_DEFINITION).unflatten(_FLAT) == nested
+
+
+def test_unflatten_sorts_sparse_indices() -> None:
+    flat = [
+        ("section[answers][7][answer]", "Last"),
+        ("section[answers][3][answer]", "First"),
+        ("group[multi][]", "b"),
+        ("group[multi][]", "a"),
+    ]
+    assert FormDataCodec(_DEFINITION).unflatten(flat) == {
+        "group": {"multi": ["b", "a"]},
+        "section": {"answers": [{"answer": "First"}, {"answer": "Last"}]},
+    }
+
+
+@pytest.mark.parametrize(
+    ("flat", "expected"),
+    [
+        ([("group[multi][1]", "x"), ("group[multi][]", "y")], ["x", "y"]),
+        ([("group[multi][]", "y"), ("group[multi][0]", "x")], ["x", "y"]),
+        ([("group[multi]", ["a", "b"]), ("group[multi][0]", "x")], ["x", "a", "b"]),
+        ([("group[multi][0]", "x"), ("group[multi]", ["a"]), ("group[multi][]", "b")], ["x", "a", "b"]),
+        ([("group[multi]", "a")], ["a"]),
+    ],
+)
+def test_unflatten_keeps_appended_and_indexed_values(flat: list[tuple[str, Any]], expected: list[str]) -> None:
+    assert FormDataCodec(_DEFINITION).unflatten(flat) == {"group": {"multi": expected}}
+
+
+def test_unflatten_values_of_iter_keys() -> None:
+    codec = FormDataCodec(_DEFINITION)
+    nested = codec.unflatten(dict.fromkeys(codec.iter_keys(), "a"))
+
+    assert nested["group"]["multi"] == ["a"]
+
+
+def test_unflatten_ignores_unknown_keys() -> None:
+    flat = {
+        "unknown": "1",
+        "static": "",
+        "input[0]": "x",
+        "group[unknown]": "",
+        "input]": "",
+        "cb1[": "",
+        "checkboxes": "",
+    }
+    assert FormDataCodec(_DEFINITION).unflatten(flat) == {"group": {}}
+
+
+@pytest.mark.parametrize("key", ["section[answers][x][answer]", "section[answers][-1][answer]", "group[multi][a]"])
+def test_unflatten_invalid_index_should_raise(key: str) -> None:
+    with pytest.raises(ValueError, match="Invalid index"):
+        FormDataCodec(_DEFINITION).unflatten({key: ""})
+
+
+def test_iter_keys() -> None:
+    codec = FormDataCodec(_DEFINITION)
+    assert list(codec.iter_keys({"section[answers]": 1, "section[answers][0][feedback]": 2})) == [
+        "input",
+        "cb1",
+        "cb2",
+        "group[multi]",
+        "section[answers][0][answer]",
+        "section[answers][0][grade]",
+        "section[answers][0][feedback][0][text]",
+        "section[answers][0][feedback][1][text]",
+    ]
+    assert sum(1 for _ in codec.iter_keys()) == 4 + 2 * 3
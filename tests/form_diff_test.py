@@ -0,0 +1,139 @@
+#  This file is part of QuestionPy. (https://questionpy.org)
+#  QuestionPy is free software released under terms of the MIT license. See LICENSE.md.
+#  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
+import pytest
+
+from questionpy_common.conditions import IsChecked
+from questionpy_common.dev.factories import FormGenerator, FormGeneratorOptions
+from questionpy_common.elements import (
+    CheckboxElement,
+    FormSection,
+    GroupElement,
+    Option,
+    OptionsFormDefinition,
+    SelectElement,
+    StaticTextElement,
+    TextInputElement,
+)
+from questionpy_common.form_diff import (
+    AddOperation,
+    FormPatch,
+    FormPatchError,
+    RemoveOperation,
+    ReorderOperation,
+    UpdateOperation,
+    apply_form_patch,
+    apply_form_patch_to_dict,
+    diff_forms,
+)
+
+
+def _form(*, label: str = "Input", options: int = 2, extra: bool = False) -> OptionsFormDefinition:
+    general = [
+        CheckboxElement(name="checkbox"),
+        GroupElement(
+            name="group",
+            label="Group",
+            elements=[
+                TextInputElement(name="input", label=label),
+                SelectElement(
+                    name="select", label="", options=[Option(label=str(i), value=str(i)) for i in range(options)]
+                ),
+            ],
+        ),
+    ]
+    if extra:
+        general.insert(1, StaticTextElement(name="static", label="", text="", hide_if=[IsChecked(name="checkbox")]))
+    return OptionsFormDefinition(
+        general=general, sections=[FormSection(name="section", header="Header", elements=[CheckboxElement(name="cb")])]
+    )
+
+
+def _assert_round_trip(old: OptionsFormDefinition, new: OptionsFormDefinition) -> FormPatch:
+    patch = diff_forms(old, new)
+    patch = FormPatch.model_validate_json(patch.model_dump_json())
+
+    assert apply_form_patch(old, patch) == new
+    assert apply_form_patch_to_dict(old.model_dump(mode="json"), patch) == new.model_dump(mode="json")
+    return patch
+
+
+def test_diff_of_equal_forms_is_empty() -> None:
+    assert diff_forms(_form(), _form()).operations == []
+
+
+def test_nested_update() -> None:
+    patch = _assert_round_trip(_form(), _form(label="Changed"))
+    assert patch.operations == [UpdateOperation(path=["general", "group", "input"], fields={"label": "Changed"})]
+
+
+def test_changed_options() -> None:
+    patch = _assert_round_trip(_form(), _form(options=3))
+    assert len(patch.operations) == 1
+    assert patch.operations[0].path == ["general", "group", "select"]  # type: ignore[union-attr]
+
+
+def test_add_and_remove() -> None:
+    patch = _assert_round_trip(_form(), _form(extra=True))
+    assert [type(operation) for operation in patch.operations] == [AddOperation]
+    assert patch.operations[0].index == 1  # type: ignore[union-attr]
+
+    patch = _assert_round_trip(_form(extra=True), _form())
+    assert patch.operations == [RemoveOperation(path=["general", "static"])]
+
+
+def test_reorder_and_kind_change() -> None:
+    old = _form()
+    new = _form()
+    new.general.reverse()
+    new.sections[0].elements = [TextInputElement(name="cb", label="Now an input")]
+
+    patch = _assert_round_trip(old, new)
+    assert ReorderOperation(parent=["general"], names=["group", "checkbox"]) in patch.operations
+    assert RemoveOperation(path=["sections", "section", "cb"]) in patch.operations
+
+
+def test_untouched_subtrees_are_shared() -> None:
+    old = _form()
+    new = apply_form_patch(old, diff_forms(old, _form(label="Changed")))
+
+    assert new.general[0] is old.general[0]
+    assert new.sections[0] is old.sections[0]
+    assert new.general[1].elements[1] is old.general[1].elements[1]  # type: ignore[union-attr]
+
+
+def test_generated_forms() -> None:
+    options = FormGeneratorOptions(depth=3, fan_out=3)
+    old = FormGenerator(seed=1, options=options).build(num_general=10, num_sections=2)
+    new = FormGenerator(seed=1, options=options).build(num_general=10, num_sections=2)
+    new.general[3:5] = []
+    new.general.insert(0, new.sections[0].elements.pop())
+    new.sections.reverse()
+
+    _assert_round_trip(old, new)
+
+
+@pytest.mark.parametrize(
+    "operation",
+    [
+        RemoveOperation(path=["general", "does_not_exist"]),
+        RemoveOperation(path=["general"]),
+        UpdateOperation(path=["somewhere", "checkbox"], fields={}),
+        UpdateOperation(path=["general", "group"], fields={"elements": []}),
+        AddOperation(parent=["general", "checkbox"], index=0, value={}),
+        AddOperation(parent=["general"], index=10, value={}),
+        ReorderOperation(parent=["general"], names=["group"]),
+    ],
+)
+def test_invalid_patch_should_raise(operation: AddOperation | RemoveOperation | UpdateOperation) -> None:
+    patch = FormPatch(operations=[operation])
+    with pytest.raises(FormPatchError):
+        apply_form_patch(_form(), patch)
+    with pytest.raises(FormPatchError):
+        apply_form_patch_to_dict(_form().model_dump(mode="json"), patch)
+
+
+def test_duplicate_names_should_raise() -> None:
+    form = OptionsFormDefinition(general=[CheckboxElement(name="a"), CheckboxElement(name="a")])
+    with pytest.raises(FormPatchError):
+        diff_forms(form, OptionsFormDefinition())
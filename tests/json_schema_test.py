@@ -0,0 +1,65 @@
+#  This file is part of QuestionPy. (https://questionpy.org)
+#  QuestionPy is free software released under terms of the MIT license. See LICENSE.md.
+#  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
+import subprocess
+import sys
+import zipfile
+from pathlib import Path
+
+import pytest
+from pydantic import BaseModel
+
+import questionpy_common
+from questionpy_common.api.attempt import UiFile
+from questionpy_common.elements import OptionsFormDefinition
+from questionpy_common.json_schema import (
+    JSON_SCHEMA_MODELS,
+    UnknownJsonSchemaError,
+    check_json_schemas,
+    get_json_schema,
+    write_json_schemas,
+)
+
+
+def test_shipped_schemas_are_up_to_date() -> None:
+    assert check_json_schemas() == [], "Run 'python -m questionpy_common.json_schema' to regenerate the schemas."
+
+
+@pytest.mark.parametrize("model", JSON_SCHEMA_MODELS.values())
+def test_get_json_schema_equals_generated_schema(model: type[BaseModel]) -> None:
+    assert get_json_schema(model) == model.model_json_schema()
+    assert get_json_schema(model.__name__) is get_json_schema(model)
+
+
+@pytest.mark.parametrize("model", [UiFile, "UiFile", "NotAModel"])
+def test_get_json_schema_should_raise_for_unknown_model(model: type[BaseModel] | str) -> None:
+    with pytest.raises(UnknownJsonSchemaError):
+        get_json_schema(model)
+
+
+def test_write_json_schemas(tmp_path: Path) -> None:
+    write_json_schemas(tmp_path)
+
+    assert (tmp_path / "index.json").is_file()
+    assert (tmp_path / "OptionsFormDefinition.json").read_text() == (
+        Path(__file__).parent.parent / "questionpy_common" / "json_schemas" / "OptionsFormDefinition.json"
+    ).read_text()
+    assert get_json_schema(OptionsFormDefinition) == OptionsFormDefinition.model_json_schema()
+
+
+def test_schemas_are_loaded_from_zip(tmp_path: Path) -> None:
+    package_dir = Path(questionpy_common.__file__).parent
+    archive = tmp_path / "package.zip"
+    with zipfile.ZipFile(archive, "w") as zip_file:
+        for path in package_dir.rglob("*"):
+            if "__pycache__" not in path.parts:
+                zip_file.write(path, path.relative_to(package_dir.parent))
+
+    script = (
+        f"import sys; sys.path.insert(0, {str(archive)!r}); "
+        "from questionpy_common.json_schema import get_json_schema; "
+        "import questionpy_common; assert questionpy_common.__file__.startswith(sys.path[0]); "
+        "print(get_json_schema('Manifest')['title'])"
+    )
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "Manifest"
@@ -0,0 +1,86 @@
+#  This file is part of QuestionPy. (https://questionpy.org)
+#  QuestionPy is free software released under terms of the MIT license. See LICENSE.md.
+#  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
+from collections.abc import Sequence
+
+import pytest
+
+from questionpy_common.environment import RequestUser
+from questionpy_common.languages import (
+    LocalizedPackageIndex,
+    fallback_chain,
+    negotiate_language,
+    normalize_language,
+)
+from questionpy_common.manifest import Manifest
+
+
+def _manifest(short_name: str, **kwargs: object) -> Manifest:
+    return Manifest(short_name=short_name, version="0.1.0", api_version="0.1", author="John Doe", **kwargs)
+
+
+def test_normalize_language() -> None:
+    assert normalize_language(" de_CH ") == "de-ch"
+
+
+@pytest.mark.parametrize(
+    ("preferred", "expected"),
+    [
+        ((), ("en",)),
+        (("de-CH", "fr"), ("de-ch", "de", "fr", "en")),
+        (("en-US", "de"), ("en-us", "en", "de")),
+        (("fr", "en", "de"), ("fr", "en", "de")),
+        (("de", "de_DE", ""), ("de", "de-de", "en")),
+    ],
+)
+def test_fallback_chain(preferred: tuple[str, ...], expected: tuple[str, ...]) -> None:
+    assert fallback_chain(preferred) == expected
+
+
+@pytest.mark.parametrize(
+    ("preferred", "available", "expected"),
+    [
+        (["de-CH"], ["en", "de"], "de"),
+        (["fr"], ["de", "en"], "en"),
+        (["fr"], ["pt", "de_AT"], "de_AT"),
+        (["de-AT"], ["de_AT", "de"], "de_AT"),
+        (["de"], [], None),
+        (["en-US", "de"], ["de", "en"], "en"),
+        (["fr", "en", "de"], ["de", "en"], "en"),
+    ],
+)
+def test_negotiate_language(preferred: Sequence[str], available: Sequence[str], expected: str | None) -> None:
+    assert negotiate_language(preferred, available) == expected
+
+
+def test_localized_package_index() -> None:
+    index = LocalizedPackageIndex([
+        _manifest(
+            "both",
+            languages={"en", "de"},
+            name={"en": "English", "de": "Deutsch"},
+            description={"de": "Beschreibung"},
+        ),
+        _manifest("unnamed", namespace="other"),
+    ])
+    assert len(index) == 2
+
+    german = index.localize(RequestUser(preferred_languages=["de-DE", "en"]))
+    assert german["@local/both"].language == "de"
+    assert german["@local/both"].name == "Deutsch"
+    assert german["@local/both"].description == "Beschreibung"
+    assert german["@other/unnamed"].name == "unnamed"
+    assert german["@other/unnamed"].language is None
+    assert german["@other/unnamed"].description is None
+
+    english = index.get("@local/both", ["fr"])
+    assert (english.language, english.name, english.description) == ("en", "English", "Beschreibung")
+
+
+def test_localized_views_are_cached_per_chain() -> None:
+    index = LocalizedPackageIndex([_manifest("a")], max_cached_chains=1)
+
+    assert index.localize(["de"]) is index.localize(["de", "de"])
+    first = index.localize(["de"])
+    index.localize(["fr"])
+    assert index.localize(["de"]) is not first
@@ -0,0 +1,79 @@
+#  This file is part of QuestionPy. (https://questionpy.org)
+#  QuestionPy is free software released under terms of the MIT license. See LICENSE.md.
+#  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
+from io import BytesIO
+
+import pytest
+
+from questionpy_common.api.attempt import (
+    AttemptScoredModel,
+    AttemptUi,
+    ClassifiedResponse,
+    ScoreModel,
+    ScoringCode,
+)
+from questionpy_common.ndjson import NdjsonError, read_ndjson, write_ndjson
+
+
+def _attempts(count: int) -> list[AttemptScoredModel]:
+    return [
+        AttemptScoredModel(
+            variant=1,
+            ui=AttemptUi(content=f"<div>{i}</div>"),
+            scoring_code=ScoringCode.AUTOMATICALLY_SCORED,
+            score=i / count,
+            classification=[ClassifiedResponse(subquestion_id="a", response_class="b", response=str(i), score=1)],
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.parametrize("compress", [False, True])
+@pytest.mark.parametrize("chunk_size", [1, 7, 1000])
+def test_round_trip(*, compress: bool, chunk_size: int) -> None:
+    attempts = _attempts(50)
+    stream = BytesIO()
+
+    assert write_ndjson(stream, attempts, compress=compress) == 50
+    stream.seek(0)
+    assert list(read_ndjson(stream, AttemptScoredModel, compressed=compress, chunk_size=chunk_size)) == attempts
+
+
+def test_format() -> None:
+    stream = BytesIO()
+    write_ndjson(stream, [ScoreModel(scoring_code=ScoringCode.NEEDS_MANUAL_SCORING, score=None)] * 2)
+
+    lines = stream.getvalue().splitlines()
+    assert len(lines) == 2
+    assert ScoreModel.model_validate_json(lines[1]).scoring_code is ScoringCode.NEEDS_MANUAL_SCORING
+
+
+def test_empty_lines_are_skipped() -> None:
+    stream = BytesIO()
+    write_ndjson(stream, _attempts(2))
+    stream = BytesIO(b"\n" + stream.getvalue().replace(b"\n", b"\n\n"))
+
+    assert len(list(read_ndjson(stream, AttemptScoredModel))) == 2
+
+
+def test_invalid_line_should_raise() -> None:
+    stream = BytesIO()
+    write_ndjson(stream, _attempts(3))
+    stream = BytesIO(stream.getvalue() + b'{"variant": "x"}\n')
+
+    records = read_ndjson(stream, AttemptScoredModel, chunk_size=2)
+    assert len([next(records), next(records)]) == 2
+    with pytest.raises(NdjsonError, match="line 4") as exc_info:
+        next(records)
+    assert exc_info.value.line == 4
+
+
+@pytest.mark.parametrize("chunk_size", [1, 1000])
+def test_line_with_several_records_should_raise(chunk_size: int) -> None:
+    first, second = (attempt.model_dump_json().encode() for attempt in _attempts(2))
+    stream = BytesIO(first + b"\n" + first + b"," + second + b"\n")
+
+    records = read_ndjson(stream, AttemptScoredModel, chunk_size=chunk_size)
+    with pytest.raises(NdjsonError, match="line 2") as exc_info:
+        list(records)
+    assert exc_info.value.line == 2
@@ -0,0 +1,72 @@
+#  This file is part of QuestionPy. (https://questionpy.org)
+#  QuestionPy is free software released under terms of the MIT license. See LICENSE.md.
+#  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
+import random
+from collections.abc import Sequence
+
+import pytest
+
+from questionpy_common.api.question import QuestionModel, ScoringMethod
+from questionpy_common.scoring import ScoringParameters, score_attempt, score_attempts
+
+_COUNTBACK = ScoringParameters(countback=True, penalty=0.25)
+_LAST_TRY = ScoringParameters(penalty=0.25)
+
+
+@pytest.mark.parametrize(
+    ("parameters", "tries", "expected"),
+    [
+        (_COUNTBACK, [], None),
+        (_COUNTBACK, [0.5], 0.5),
+        (_COUNTBACK, [0.5, 1], 0.75),
+        (_COUNTBACK, [1, 0], 1),
+        (_COUNTBACK, [0, 0, 0, 0, 0.5], 0),
+        (_LAST_TRY, [1, 0.5], 0.25),
+        (_LAST_TRY, [1, 0, 0, 1], 0.25),
+        (ScoringParameters(score_min=-1, score_max=2), [3], 2),
+        (ScoringParameters(score_min=-1, score_max=2), [-3], -1),
+    ],
+)
+def test_score_attempt(parameters: ScoringParameters, tries: Sequence[float], expected: float | None) -> None:
+    assert score_attempt(parameters, tries) == expected
+
+
+def test_adjust_for_guessing() -> None:
+    parameters = ScoringParameters(random_guess_score=0.25)
+
+    assert score_attempt(parameters, [0.25], adjust_for_guessing=True) == 0
+    assert score_attempt(parameters, [0.625], adjust_for_guessing=True) == pytest.approx(0.5)
+    assert score_attempt(parameters, [0.1], adjust_for_guessing=True) == 0
+    assert score_attempt(parameters, [0.625]) == pytest.approx(0.625)
+    assert score_attempt(ScoringParameters(random_guess_score=1), [0.5], adjust_for_guessing=True) == pytest.approx(0.5)
+
+
+def test_parameters_from_question() -> None:
+    question = QuestionModel(
+        scoring_method=ScoringMethod.AUTOMATICALLY_SCORABLE_WITH_COUNTBACK,
+        penalty=0.1,
+        score_max=2,
+        random_guess_score=0.5,
+    )
+    assert ScoringParameters.from_question(question) == ScoringParameters(
+        countback=True, penalty=0.1, score_max=2, random_guess_score=0.5
+    )
+    assert score_attempt(question, [0, 2]) == pytest.approx(1.9)
+
+    with pytest.raises(ValueError, match="manual scoring"):
+        score_attempt(QuestionModel(scoring_method=ScoringMethod.ALWAYS_MANUAL_SCORING_REQUIRED), [1])
+
+
+@pytest.mark.parametrize("countback", [True, False])
+@pytest.mark.parametrize("adjust_for_guessing", [True, False])
+def test_score_attempts_matches_reference(*, countback: bool, adjust_for_guessing: bool) -> None:
+    rnd = random.Random(42)
+    parameters = ScoringParameters(
+        countback=countback, penalty=1 / 3, score_min=-0.5, score_max=1.5, random_guess_score=0.3
+    )
+    attempts = [[rnd.uniform(-1, 2) for _ in range(rnd.randrange(6))] for _ in range(2000)]
+
+    assert score_attempts(parameters, attempts, adjust_for_guessing=adjust_for_guessing) == [
+        score_attempt(parameters, tries, adjust_for_guessing=adjust_for_guessing) for tries in attempts
+    ]
+    assert score_attempts(parameters, []) == []
@@ -0,0 +1,83 @@
+#  This file is part of QuestionPy. (https://questionpy.org)
+#  QuestionPy is free software released under terms of the MIT license. See LICENSE.md.
+#  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
+import pytest
+
+from questionpy_common.manifest import Manifest
+from questionpy_common.search import ManifestSearchIndex, tokenize
+
+
+def _manifest(short_name: str, **kwargs: object) -> Manifest:
+    return Manifest(**{"version": "0.1.0", "api_version": "0.1", "author": "John Doe", **kwargs}, short_name=short_name)
+
+
+@pytest.fixture
+def index() -> ManifestSearchIndex:
+    return ManifestSearchIndex([
+        _manifest(
+            "multiple_choice",
+            name={"en": "Multiple choice", "de": "Mehrfachauswahl"},
+            description={"en": "Choose one or more of the answers", "de": "Wähle eine oder mehrere Antworten"},
+            tags={"choice"},
+        ),
+        _manifest("drag_and_drop", name={"en": "Drag and drop"}, description={"en": "Drag words into gaps"}),
+        _manifest("gap_fill", author="Jane Roe", name={"de": "Lückentext"}, tags={"gaps", "text"}),
+    ])
+
+
+def _identifiers(index: ManifestSearchIndex, query: str, **kwargs: object) -> list[str]:
+    return [hit.identifier for hit in index.search(query, **kwargs)]  # type: ignore[arg-type]
+
+
+def test_tokenize() -> None:
+    assert tokenize("Über_alles, the Café!") == ["uber", "alles", "the", "cafe"]
+    assert tokenize("The answer and the question", "en-US") == ["answer", "question"]
+    assert tokenize("Die Antwort", "de") == ["antwort"]
+
+
+def test_search_ranks_by_field_weight(index: ManifestSearchIndex) -> None:
+    assert _identifiers(index, "gaps") == ["@local/gap_fill", "@local/drag_and_drop"]
+
+
+def test_search_requires_all_tokens(index: ManifestSearchIndex) -> None:
+    assert _identifiers(index, "drag gaps") == ["@local/drag_and_drop"]
+    assert _identifiers(index, "drag unknown") == []
+    assert _identifiers(index, "") == []
+
+
+def test_search_with_stopwords(index: ManifestSearchIndex) -> None:
+    index.add(_manifest("die_roller", name={"en": "Roll the die"}))
+
+    assert _identifiers(index, "die") == ["@local/die_roller"]
+    assert _identifiers(index, "the drag") == ["@local/drag_and_drop"]
+    assert _identifiers(index, "die roll") == ["@local/die_roller"]
+    assert _identifiers(index, "drag and drop", languages=["de"]) == ["@local/drag_and_drop"]
+
+
+def test_search_prefix_and_folding(index: ManifestSearchIndex) -> None:
+    assert _identifiers(index, "LUCKEN") == ["@local/gap_fill"]
+    assert _identifiers(index, "mehrf") == ["@local/multiple_choice"]
+    assert _identifiers(index, "mehrf", prefix=False) == []
+
+
+def test_search_restricted_to_languages(index: ManifestSearchIndex) -> None:
+    assert _identifiers(index, "antworten", languages=["de-DE"]) == ["@local/multiple_choice"]
+    assert _identifiers(index, "antworten", languages=["en"]) == []
+    assert _identifiers(index, "choice", languages=["de"]) == ["@local/multiple_choice"]
+
+
+def test_search_limit(index: ManifestSearchIndex) -> None:
+    assert len(index.search("doe", limit=None)) == 2
+    assert len(index.search("doe", limit=1)) == 1
+
+
+def test_incremental_updates(index: ManifestSearchIndex) -> None:
+    index.add(_manifest("gap_fill", name={"en": "Cloze"}))
+    assert _identifiers(index, "cloze") == ["@local/gap_fill"]
+    assert _identifiers(index, "lückentext") == []
+
+    index.remove("@local/gap_fill")
+    index.remove("@local/does_not_exist")
+    assert len(index) == 2
+    assert "@local/gap_fill" not in index
+    assert _identifiers(index, "cloze") == []
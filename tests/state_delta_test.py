@@ -0,0 +1,104 @@
+#  This file is part of QuestionPy. (https://questionpy.org)
+#  QuestionPy is free software released under terms of the MIT license. See LICENSE.md.
+#  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
+import json
+
+import pytest
+
+from questionpy_common.constants import MAX_QUESTION_STATE_SIZE
+from questionpy_common.state_delta import DELTA_PREFIX, decode_attempt_state, encode_attempt_state
+
+_QUESTION_STATE = json.dumps({
+    "options": [f"Option {i}" for i in range(100)],
+    "settings": {"shuffle": True, "feedback": "Some long feedback text " * 10, "hint": "Some hint"},
+    "unused": None,
+})
+
+
+def test_round_trip_and_size() -> None:
+    question = json.loads(_QUESTION_STATE)
+    attempt = {
+        **question,
+        "options": question["options"][::-1],
+        "settings": {"shuffle": True, "feedback": question["settings"]["feedback"], "seed": 42},
+        "responses": {"a": [1, 2]},
+    }
+    del attempt["unused"]
+    attempt_state = json.dumps(attempt)
+
+    encoded = encode_attempt_state(_QUESTION_STATE, attempt_state)
+    assert encoded.startswith(DELTA_PREFIX)
+    assert len(encoded) < len(attempt_state)
+    assert json.loads(decode_attempt_state(_QUESTION_STATE, encoded)) == attempt
+
+
+def test_unchanged_attempt_state_is_tiny() -> None:
+    encoded = encode_attempt_state(_QUESTION_STATE, _QUESTION_STATE)
+    assert len(encoded) < 60
+    assert json.loads(decode_attempt_state(_QUESTION_STATE, encoded)) == json.loads(_QUESTION_STATE)
+
+
+@pytest.mark.parametrize(
+    ("question_state", "attempt_state"),
+    [
+        (_QUESTION_STATE, "not json"),
+        (_QUESTION_STATE, "[1, 2, 3]"),
+        ("not json", json.dumps({"a": 1})),
+        (_QUESTION_STATE, json.dumps({"completely": "different"})),
+    ],
+)
+def test_unencodable_states_are_passed_through(question_state: str, attempt_state: str) -> None:
+    assert encode_attempt_state(question_state, attempt_state) == attempt_state
+    assert decode_attempt_state(question_state, attempt_state) == attempt_state
+
+
+def test_decode_with_other_question_state_should_raise() -> None:
+    encoded = encode_attempt_state(_QUESTION_STATE, _QUESTION_STATE)
+    with pytest.raises(ValueError, match="different question state"):
+        decode_attempt_state(json.dumps({"other": 1}), encoded)
+
+
+def test_unencoded_state_with_prefix_should_raise() -> None:
+    with pytest.raises(ValueError, match="can not be stored unencoded"):
+        encode_attempt_state(_QUESTION_STATE, DELTA_PREFIX + "x")
+
+
+def test_too_large_state_should_raise() -> None:
+    attempt_state = json.dumps({"data": "x" * MAX_QUESTION_STATE_SIZE})
+    with pytest.raises(ValueError, match="larger than"):
+        encode_attempt_state(_QUESTION_STATE, attempt_state)
+
+
+@pytest.mark.parametrize("payload", ["[]", '{"base": "x"}'])
+def test_decode_malformed_state_should_raise(payload: str) -> None:
+    with pytest.raises(ValueError, match="malformed"):
+        decode_attempt_state(_QUESTION_STATE, DELTA_PREFIX + payload)
+
+
+@pytest.mark.parametrize(
+    "delta",
+    [
+        {"p": {"missing": {"p": {}}}},
+        {"r": 5},
+        {"p": []},
+        {"x": {}},
+        {"p": {"unused": []}},
+        "delta",
+        5,
+    ],
+)
+def test_decode_malformed_delta_should_raise(delta: object) -> None:
+    encoded = encode_attempt_state(_QUESTION_STATE, _QUESTION_STATE)
+    payload = {**json.loads(encoded.removeprefix(DELTA_PREFIX)), "delta": delta}
+
+    with pytest.raises(ValueError, match="malformed"):
+        decode_attempt_state(_QUESTION_STATE, DELTA_PREFIX + json.dumps(payload))
+
+
+def test_type_changes_are_kept() -> None:
+    question_state = json.dumps({"flag": 1, "n": 2.0, "items": [1, 0], "nested": {"a": False}, "text": "x" * 100})
+    attempt = {"flag": True, "n": 2, "items": [True, False], "nested": {"a": 0}, "text": "x" * 100}
+
+    encoded = encode_attempt_state(question_state, json.dumps(attempt))
+    assert encoded.startswith(DELTA_PREFIX)
+    assert decode_attempt_state(question_state, encoded) == json.dumps(attempt, separators=(",", ":"))
@@ -0,0 +1,81 @@
+#  This file is part of QuestionPy. (https://questionpy.org)
+#  QuestionPy is free software released under terms of the MIT license. See LICENSE.md.
+#  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from questionpy_common.api.attempt import AttemptScoredModel, AttemptUi, ClassifiedResponse, ScoringCode, UiFile
+from questionpy_common.api.question import QuestionModel, ScoringMethod, SubquestionModel
+from questionpy_common.dev.factories import FormGenerator
+from questionpy_common.elements import TextInputElement
+from questionpy_common.manifest import Manifest, PackageType
+from questionpy_common.trusted import TrustedLoader
+
+_MODELS = [
+    FormGenerator(seed=1).build(30, 3),
+    QuestionModel(
+        scoring_method=ScoringMethod.AUTOMATICALLY_SCORABLE_WITH_COUNTBACK,
+        penalty=0.1,
+        subquestions=[SubquestionModel(subquestion_id="a", score_max=2, response_classes=None)],
+    ),
+    AttemptScoredModel(
+        variant=2,
+        ui=AttemptUi(content="<div/>", files=[UiFile(name="a.png", data="AAAA", mime_type="image/png")]),
+        scoring_code=ScoringCode.NEEDS_MANUAL_SCORING,
+        score=None,
+        classification=[ClassifiedResponse(subquestion_id="a", response_class="b", response="c", score=1)],
+    ),
+    Manifest(
+        short_name="example",
+        namespace="local",
+        version="1.0.0",
+        api_version="0.1",
+        author="Author",
+        type=PackageType.LIBRARY,
+        name={"en": "Example"},
+        tags=["a", "b"],
+    ),
+]
+
+
+@pytest.mark.parametrize("original", _MODELS, ids=lambda model: type(model).__name__)
+def test_strictly_validated_models_equal_originals(original: BaseModel) -> None:
+    loader = TrustedLoader(1)
+
+    for data in (original.model_dump_json(), original.model_dump_json().encode()):
+        assert loader.load(type(original), data) == original
+    assert loader.validated == loader.loaded == 2
+
+
+def test_trusted_loader_validates_sample() -> None:
+    loader = TrustedLoader(0.5, seed=0)
+    data = TextInputElement(name="a", label="A").model_dump_json()
+
+    for _ in range(200):
+        assert loader.load(TextInputElement, data) == TextInputElement(name="a", label="A")
+
+    assert loader.loaded == 200
+    assert 50 < loader.validated < 150
+
+
+@pytest.mark.parametrize(("fraction", "raises"), [(0, False), (1, True)])
+def test_trusted_loader_rejects_coercion_only_in_sample(*, fraction: float, raises: bool) -> None:
+    loader = TrustedLoader(fraction)
+    data = '{"kind": "input", "name": "a", "label": "A", "required": "true"}'
+
+    if raises:
+        with pytest.raises(ValidationError):
+            loader.load(TextInputElement, data)
+    else:
+        assert loader.load(TextInputElement, data).required
+
+
+def test_trusted_loader_always_validates() -> None:
+    with pytest.raises(ValidationError):
+        TrustedLoader().load(TextInputElement, '{"kind": "input", "name": "a"}')
+
+
+@pytest.mark.parametrize("fraction", [-0.1, 1.5])
+def test_trusted_loader_rejects_invalid_fraction(fraction: float) -> None:
+    with pytest.raises(ValueError, match="validate_fraction"):
+        TrustedLoader(fraction)
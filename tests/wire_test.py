@@ -0,0 +1,157 @@
+#  This file is part of QuestionPy. (https://questionpy.org)
+#  QuestionPy is free software released under terms of the MIT license. See LICENSE.md.
+#  (c) Technische Universität Berlin, innoCampus <info@isis.tu-berlin.de>
+from typing import Any
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from questionpy_common.api.attempt import AttemptScoredModel, AttemptUi, CacheControl, ScoringCode, UiFile
+from questionpy_common.api.question import QuestionModel, ScoringMethod
+from questionpy_common.dev.factories import FormGenerator
+from questionpy_common.dev.wire_benchmark import benchmark_wire_codecs
+from questionpy_common.manifest import Manifest, PackageType
+from questionpy_common.wire import (
+    WIRE_ENUMS,
+    JsonCodec,
+    MsgpackCodec,
+    UnsupportedCodecError,
+    WireFormatError,
+    negotiate_codec,
+    supported_media_types,
+)
+
+_MODELS = [
+    FormGenerator(seed=1).build(30, 3),
+    QuestionModel(scoring_method=ScoringMethod.AUTOMATICALLY_SCORABLE_WITH_COUNTBACK, penalty=0.1),
+    AttemptScoredModel(
+        variant=2,
+        ui=AttemptUi(
+            content="<div/>",
+            cache_control=CacheControl.SHARED_CACHE,
+            files=[UiFile(name="a.svg", data="<svg/>", mime_type="image/svg+xml")],
+        ),
+        scoring_code=ScoringCode.NEEDS_MANUAL_SCORING,
+        score=None,
+    ),
+    Manifest(
+        short_name="example",
+        version="1.0.0",
+        api_version="0.1",
+        author="Author",
+        type=PackageType.LIBRARY,
+        tags={"a", "b"},
+        permissions={"x"},
+    ),
+]
+
+
+@pytest.fixture
+def msgpack() -> Any:
+    return pytest.importorskip("msgpack")
+
+
+@pytest.mark.parametrize("model", _MODELS, ids=lambda model: type(model).__name__)
+def test_json_codec_round_trip(model: BaseModel) -> None:
+    codec = JsonCodec()
+
+    assert codec.encode(model) == model.model_dump_json().encode()
+    assert codec.decode(type(model), codec.encode(model)) == model
+
+
+@pytest.mark.usefixtures("msgpack")
+@pytest.mark.parametrize("model", _MODELS, ids=lambda model: type(model).__name__)
+def test_msgpack_codec_round_trip(model: BaseModel) -> None:
+    codec = MsgpackCodec("0.1")
+
+    assert codec.decode(type(model), codec.encode(model)) == model
+
+
+@pytest.mark.usefixtures("msgpack")
+def test_msgpack_codec_is_smaller_than_json() -> None:
+    form = FormGenerator(seed=2).build(100, 5)
+
+    assert len(MsgpackCodec("0.1").encode(form)) < len(JsonCodec().encode(form))
+
+
+def test_msgpack_codec_encodes_enums_as_index(msgpack: Any) -> None:
+    model = QuestionModel(scoring_method=ScoringMethod.AUTOMATICALLY_SCORABLE_WITH_COUNTBACK)
+
+    major, minor, payload = msgpack.unpackb(MsgpackCodec("0.1").encode(model))
+
+    assert (major, minor) == (0, 1)
+    code = WIRE_ENUMS.index(ScoringMethod) + 1
+    assert payload["scoring_method"] == msgpack.ExtType(code, bytes([list(ScoringMethod).index(model.scoring_method)]))
+
+
+def test_msgpack_codec_accepts_other_minor_version(msgpack: Any) -> None:
+    model = QuestionModel(scoring_method=ScoringMethod.ALWAYS_MANUAL_SCORING_REQUIRED)
+
+    assert MsgpackCodec("0.1").decode(QuestionModel, MsgpackCodec("0.7").encode(model)) == model
+
+
+@pytest.mark.usefixtures("msgpack")
+def test_msgpack_codec_rejects_other_major_version() -> None:
+    data = MsgpackCodec("1.0").encode(QuestionModel(scoring_method=ScoringMethod.ALWAYS_MANUAL_SCORING_REQUIRED))
+
+    with pytest.raises(WireFormatError, match=r"API version 1\.0"):
+        MsgpackCodec("0.1").decode(QuestionModel, data)
+
+
+@pytest.mark.parametrize("message", [[0, 1], [0, 1, [], 4], ["0", 1, {}], {"major": 0}])
+def test_msgpack_codec_rejects_malformed_messages(msgpack: Any, message: Any) -> None:
+    with pytest.raises(WireFormatError, match="not a versioned model"):
+        MsgpackCodec("0.1").decode(QuestionModel, msgpack.packb(message))
+
+
+@pytest.mark.parametrize("data", [b"\xc1", b"\x93\x00\x01"])
+def test_msgpack_codec_rejects_invalid_messagepack(data: bytes) -> None:
+    pytest.importorskip("msgpack")
+    with pytest.raises(WireFormatError, match="not valid MessagePack"):
+        MsgpackCodec("0.1").decode(QuestionModel, data)
+
+
+@pytest.mark.parametrize(("code", "data"), [(100, b"\x00"), (1, b"\x09"), (1, b"\x00\x00")])
+def test_msgpack_codec_rejects_unknown_enums(msgpack: Any, code: int, data: bytes) -> None:
+    message = msgpack.packb([0, 1, {"scoring_method": msgpack.ExtType(code, data)}])
+
+    with pytest.raises(WireFormatError, match="Unknown extension type"):
+        MsgpackCodec("0.1").decode(QuestionModel, message)
+
+
+def test_msgpack_codec_validates(msgpack: Any) -> None:
+    with pytest.raises(ValidationError):
+        MsgpackCodec("0.1").decode(QuestionModel, msgpack.packb([0, 1, {"num_variants": 0}]))
+
+
+@pytest.mark.parametrize("api_version", ["1", "a.b", "1.0.0"])
+def test_msgpack_codec_rejects_invalid_api_version(api_version: str) -> None:
+    pytest.importorskip("msgpack")
+    with pytest.raises(ValueError, match="API version"):
+        MsgpackCodec(api_version)
+
+
+@pytest.mark.usefixtures("msgpack")
+@pytest.mark.parametrize(
+    ("offered", "expected"),
+    [
+        (["application/vnd.msgpack", "application/json"], MsgpackCodec),
+        (["application/json;q=0.9", "application/vnd.msgpack"], JsonCodec),
+        (["text/html", " Application/VND.msgpack "], MsgpackCodec),
+    ],
+)
+def test_negotiate_codec(offered: list[str], expected: type) -> None:
+    assert type(negotiate_codec(offered, api_version="0.1")) is expected
+    assert supported_media_types() == ["application/vnd.msgpack", "application/json"]
+
+
+def test_negotiate_codec_raises_if_nothing_is_supported() -> None:
+    with pytest.raises(UnsupportedCodecError, match="application/json"):
+        negotiate_codec(["text/html"], api_version="0.1")
+
+
+def test_benchmark_covers_available_codecs() -> None:
+    results = benchmark_wire_codecs(number=1)
+
+    assert {result.codec for result in results} >= {"JsonCodec"}
+    assert all(result.size > 0 for result in results)